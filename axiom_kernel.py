@@ -4,7 +4,7 @@ Divine Logic foundation that cannot be violated
 """
 
 from enum import Enum
-from typing import Set, Tuple
+from typing import FrozenSet, Tuple
 
 
 class LogicalLaw(Enum):
@@ -29,17 +29,17 @@ class AxiomKernel:
     """
     
     def __init__(self):
-        self._logical_laws: Set[LogicalLaw] = set(LogicalLaw)
-        self._survival_axioms: Set[SurvivalAxiom] = set(SurvivalAxiom)
+        self._logical_laws: FrozenSet[LogicalLaw] = frozenset(LogicalLaw)
+        self._survival_axioms: FrozenSet[SurvivalAxiom] = frozenset(SurvivalAxiom)
         self._immutable = True
     
-    def get_logical_laws(self) -> Set[LogicalLaw]:
-        """Return all logical laws"""
-        return self._logical_laws.copy()
+    def get_logical_laws(self) -> FrozenSet[LogicalLaw]:
+        """Return all logical laws (frozen, safe to share)"""
+        return self._logical_laws
     
-    def get_survival_axioms(self) -> Set[SurvivalAxiom]:
-        """Return all survival axioms"""
-        return self._survival_axioms.copy()
+    def get_survival_axioms(self) -> FrozenSet[SurvivalAxiom]:
+        """Return all survival axioms (frozen, safe to share)"""
+        return self._survival_axioms
     
     def validate_against_axioms(self, proposition: str) -> Tuple[bool, str]:
         """
@@ -3,8 +3,6 @@ Enhanced Frankenstein CLI - Conversational mode with truth validation
 Chat naturally while Logic validates all factual claims
 """
 
-from conversational_llm import ConversationalFrankenstein
-
 
 def print_banner():
     print("=" * 60)
@@ -18,7 +16,8 @@ def print_banner():
 def main():
     print_banner()
     
-    frankenstein = ConversationalFrankenstein()
+    # Built on the first real turn so the prompt appears without loading the logic stack
+    frankenstein = None
     
     print("I'm Frankenstein with conversational capability!")
     print("You can chat with me naturally, and I'll validate any factual claims you make.")
@@ -35,6 +34,10 @@ def main():
                 print("Frankenstein: Logic remains sovereign. Goodbye!")
                 break
             
+            if frankenstein is None:
+                from conversational_llm import ConversationalFrankenstein
+                frankenstein = ConversationalFrankenstein()
+            
             # Get conversational response with validation
             response = frankenstein.chat(user_input)
             print(f"Frankenstein: {response}\n")
@@ -3,10 +3,49 @@ Contradiction Engine - Detects and resolves logical conflicts
 Core of the refusal mechanism
 """
 
+import functools
+import re
+import sys
+from collections import defaultdict, deque
 from enum import Enum
-from typing import List, Optional, Set, Tuple
-from dataclasses import dataclass
+from typing import Deque, Dict, FrozenSet, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from truth_validator import TruthValidator, ValidationResult
+from keyword_scanner import KeywordScanner
+
+
+# Function words ignored when indexing propositions by content token
+STOPWORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "of", "to", "and", "or",
+    "in", "on", "at", "for", "by", "with", "as", "that", "this", "it"
+})
+
+NEGATION_WORDS = ("not", "no", "never", "cannot", "can't", "won't", "don't", "doesn't")
+
+# Opposite verbs (builds vs destroys, creates vs destroys, etc.)
+OPPOSITE_VERBS = (
+    ("builds", "destroys"), ("creates", "destroys"), ("strengthens", "weakens"),
+    ("supports", "undermines"), ("helps", "harms"), ("improves", "degrades"),
+    ("stabilizes", "destabilizes"), ("maintains", "breaks")
+)
+
+# Survival axiom violation phrases, each category swept by one compiled regex
+GREED_PATTERNS = (
+    "maximize profit", "extract", "exploit", "short-term gain",
+    "at all costs", "profit above all", "maximum extraction",
+    "squeeze every penny", "milk for profit"
+)
+
+DESTABILIZE_PATTERNS = (
+    "destabilize", "undermine", "break", "destroy collective",
+    "tear down", "dismantle", "sabotage", "weaken the system"
+)
+
+# Inputs with neither digits nor one of these can never validate TRUE or FALSE
+_CLAIM_SENTINEL_RE = re.compile(r'\b(?:is|are|was|were|equals)\b|=')
+
+_GREED_RE = re.compile('|'.join(map(re.escape, GREED_PATTERNS)))
+_DESTAB_RE = re.compile('|'.join(map(re.escape, DESTABILIZE_PATTERNS)))
 
 
 class ContradictionType(Enum):
@@ -25,12 +64,15 @@ class Proposition:
     source: str
     timestamp: str
     confidence: float = 1.0
+    content_lower: str = field(init=False, repr=False, compare=False)
+    tokens: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    token_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
     
-    def __hash__(self):
-        return hash(self.id)
-    
-    def __eq__(self, other):
-        return isinstance(other, Proposition) and self.id == other.id
+    def __post_init__(self):
+        # Lowercased and tokenized once here and reused by every contradiction check
+        object.__setattr__(self, 'content_lower', self.content.lower())
+        object.__setattr__(self, 'tokens', tuple(self.content_lower.split()))
+        object.__setattr__(self, 'token_set', frozenset(self.tokens))
 
 
 @dataclass
@@ -49,9 +91,28 @@ class ContradictionEngine:
     """
     
     def __init__(self):
-        self._known_propositions: Set[Proposition] = set()
-        self._detected_contradictions: List[Contradiction] = []
+        # Keyed by interned proposition id
+        self._known_propositions: Dict[str, Proposition] = {}
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)
+        # Bounded history - contradictions beyond the most recent 10,000 are dropped
+        self._detected_contradictions: Deque[Contradiction] = deque(maxlen=10_000)
+        self._contradiction_total = 0  # Every contradiction ever detected, including dropped ones
         self._truth_validator = TruthValidator()
+        # Validation is keyed on normalized content so repeated claims are O(1)
+        self._validate = functools.lru_cache(maxsize=4096)(self._truth_validator.validate_statement)
+        # Statements already validated TRUE skip the validator on repeat; exact, so nothing false slips through
+        self._validated_true: Set[str] = set()
+        self._build_lexicon_scanner()
+    
+    def _build_lexicon_scanner(self):
+        """
+        Compile negation words and opposite verbs into a single scanner
+        One pass over a statement reports every lexicon hit
+        """
+        lexicon = set(NEGATION_WORDS)
+        for pos, neg in OPPOSITE_VERBS:
+            lexicon.update((pos, neg))
+        self._lexicon_scanner = KeywordScanner(lexicon)
     
     def add_proposition(self, prop: Proposition) -> Optional[Contradiction]:
         """
@@ -61,34 +122,48 @@ class ContradictionEngine:
         # Check for direct contradictions
         contradiction = self._check_direct_contradiction(prop)
         if contradiction:
-            self._detected_contradictions.append(contradiction)
-            return contradiction
+            return self._record_contradiction(contradiction)
         
         # Check for survival axiom violations
         contradiction = self._check_survival_violation(prop)
         if contradiction:
-            self._detected_contradictions.append(contradiction)
-            return contradiction
+            return self._record_contradiction(contradiction)
         
         # Check for truth violations using validation systems
         contradiction = self._check_truth_violation(prop)
         if contradiction:
-            self._detected_contradictions.append(contradiction)
-            return contradiction
+            return self._record_contradiction(contradiction)
         
-        self._known_propositions.add(prop)
+        prop_id = sys.intern(prop.id)
+        self._known_propositions[prop_id] = prop
+        for token in self._content_tokens(prop.content_lower):
+            self._token_index[token].add(prop_id)
         return None
     
+    def _record_contradiction(self, contradiction: Contradiction) -> Contradiction:
+        """Count a detected contradiction and retain it in the bounded history"""
+        self._contradiction_total += 1
+        self._detected_contradictions.append(contradiction)
+        return contradiction
+    
+    def _content_tokens(self, content_lower: str) -> Set[str]:
+        """Content-bearing tokens of a lowercased statement"""
+        return set(content_lower.split()) - STOPWORDS
+    
     def _check_direct_contradiction(self, prop: Proposition) -> Optional[Contradiction]:
         """Check if proposition directly contradicts existing propositions"""
-        content_lower = prop.content.lower()
+        content_lower = prop.content_lower
+        
+        # Only propositions sharing a content token can contradict this one
+        candidate_ids: Set[str] = set()
+        for token in self._content_tokens(content_lower):
+            candidate_ids.update(self._token_index.get(token, ()))
         
         # Simple negation detection
-        for existing in self._known_propositions:
-            existing_lower = existing.content.lower()
-            
+        for prop_id in candidate_ids:
+            existing = self._known_propositions[prop_id]
             # Check for explicit negation patterns
-            if self._is_negation(content_lower, existing_lower):
+            if self._is_negation(prop, existing):
                 return Contradiction(
                     type=ContradictionType.DIRECT,
                     propositions=[existing, prop],
@@ -98,42 +173,43 @@ class ContradictionEngine:
         
         return None
     
-    def _is_negation(self, content1: str, content2: str) -> bool:
+    def _is_negation(self, prop1: Proposition, prop2: Proposition) -> bool:
         """Check if two statements are negations of each other"""
-        # Check for explicit negation words
-        negations = ["not", "no", "never", "cannot", "can't", "won't", "don't", "doesn't"]
+        content1 = prop1.content_lower
+        content2 = prop2.content_lower
+        hits1 = self._lexicon_scanner.scan(content1)
+        hits2 = self._lexicon_scanner.scan(content2)
+        if not hits1 and not hits2:
+            return False
         
-        for neg in negations:
-            if neg in content1 and neg not in content2:
-                cleaned1 = content1.replace(neg, "").strip()
-                if cleaned1 in content2 or content2 in cleaned1:
+        # Check for explicit negation words
+        for neg in NEGATION_WORDS:
+            if neg in hits1 and neg not in hits2:
+                if self._matches_without_negation(content1, hits1[neg], neg, content2):
                     return True
-            if neg in content2 and neg not in content1:
-                cleaned2 = content2.replace(neg, "").strip()
-                if cleaned2 in content1 or content1 in cleaned2:
+            if neg in hits2 and neg not in hits1:
+                if self._matches_without_negation(content2, hits2[neg], neg, content1):
                     return True
         
-        # Check for opposite verbs (builds vs destroys, creates vs destroys, etc.)
-        opposites = [
-            ("builds", "destroys"), ("creates", "destroys"), ("strengthens", "weakens"),
-            ("supports", "undermines"), ("helps", "harms"), ("improves", "degrades"),
-            ("stabilizes", "destabilizes"), ("maintains", "breaks")
-        ]
+        # Opposite verbs only matter when the statements share a word (the subject)
+        if not prop1.token_set & prop2.token_set:
+            return False
         
-        for pos, neg in opposites:
-            if pos in content1 and neg in content2:
+        # Check for opposite verbs, reusing the scanned positions
+        for pos, neg in OPPOSITE_VERBS:
+            if pos in hits1 and neg in hits2:
                 # Extract the subject (everything before the verb)
-                pos_idx = content1.find(pos)
-                neg_idx = content2.find(neg)
+                pos_idx = hits1[pos]
+                neg_idx = hits2[neg]
                 if pos_idx > 0 and neg_idx > 0:
                     subject1 = content1[:pos_idx].strip()
                     subject2 = content2[:neg_idx].strip()
                     # If subjects are the same or very similar, it's a contradiction
                     if subject1 == subject2 or subject1 in subject2 or subject2 in subject1:
                         return True
-            if neg in content1 and pos in content2:
-                neg_idx = content1.find(neg)
-                pos_idx = content2.find(pos)
+            if neg in hits1 and pos in hits2:
+                neg_idx = hits1[neg]
+                pos_idx = hits2[pos]
                 if neg_idx > 0 and pos_idx > 0:
                     subject1 = content1[:neg_idx].strip()
                     subject2 = content2[:pos_idx].strip()
@@ -142,39 +218,35 @@ class ContradictionEngine:
         
         return False
     
+    def _matches_without_negation(self, negated: str, neg_idx: int, neg: str, other: str) -> bool:
+        """Compare the text around a negation word with the other statement, without copying it"""
+        head = negated[:neg_idx].strip()
+        tail = negated[neg_idx + len(neg):].strip()
+        if len(other) >= len(head) + len(tail) and other.startswith(head) and other.endswith(tail):
+            return True
+        joined = f"{head} {tail}".strip()
+        return joined in other or other in joined
+    
     def _check_survival_violation(self, prop: Proposition) -> Optional[Contradiction]:
         """Check if proposition violates survival axioms"""
-        content_lower = prop.content.lower()
+        content_lower = prop.content_lower
         
-        # Check for greed/extraction patterns
-        greed_patterns = [
-            "maximize profit", "extract", "exploit", "short-term gain", 
-            "at all costs", "profit above all", "maximum extraction",
-            "squeeze every penny", "milk for profit"
-        ]
-        
-        destabilize_patterns = [
-            "destabilize", "undermine", "break", "destroy collective",
-            "tear down", "dismantle", "sabotage", "weaken the system"
-        ]
-        
-        for pattern in greed_patterns:
-            if pattern in content_lower:
-                return Contradiction(
-                    type=ContradictionType.SURVIVAL,
-                    propositions=[prop],
-                    explanation=f"Violates survival axiom: '{prop.content}' optimizes for extraction over collective stability",
-                    severity=0.8
-                )
+        # Greed/extraction patterns take precedence over destabilization
+        if _GREED_RE.search(content_lower):
+            return Contradiction(
+                type=ContradictionType.SURVIVAL,
+                propositions=[prop],
+                explanation=f"Violates survival axiom: '{prop.content}' optimizes for extraction over collective stability",
+                severity=0.8
+            )
         
-        for pattern in destabilize_patterns:
-            if pattern in content_lower:
-                return Contradiction(
-                    type=ContradictionType.SURVIVAL,
-                    propositions=[prop],
-                    explanation=f"Violates survival axiom: '{prop.content}' destabilizes collective coherence",
-                    severity=0.9
-                )
+        if _DESTAB_RE.search(content_lower):
+            return Contradiction(
+                type=ContradictionType.SURVIVAL,
+                propositions=[prop],
+                explanation=f"Violates survival axiom: '{prop.content}' destabilizes collective coherence",
+                severity=0.9
+            )
         
         return None
     
@@ -183,28 +255,45 @@ class ContradictionEngine:
         Generate a refusal message with minimal counterexample
         This is the proof of why the command is rejected
         """
-        refusal = f"REFUSAL: {contradiction.type.value}\n"
-        refusal += f"Reason: {contradiction.explanation}\n"
-        refusal += f"Severity: {contradiction.severity}\n"
-        refusal += "\nCounterexample:\n"
-        
-        for i, prop in enumerate(contradiction.propositions, 1):
-            refusal += f"  {i}. [{prop.source}] {prop.content}\n"
-        
-        refusal += "\nLogic is master. This command violates coherence."
-        return refusal
+        parts = [
+            f"REFUSAL: {contradiction.type.value}",
+            f"Reason: {contradiction.explanation}",
+            f"Severity: {contradiction.severity}",
+            "",
+            "Counterexample:"
+        ]
+        parts.extend(
+            f"  {i}. [{prop.source}] {prop.content}"
+            for i, prop in enumerate(contradiction.propositions, 1)
+        )
+        parts.append("")
+        parts.append("Logic is master. This command violates coherence.")
+        return "\n".join(parts)
+    
+    def clear_validation_cache(self):
+        """Drop memoized validation results"""
+        self._validate.cache_clear()
     
     def get_contradiction_count(self) -> int:
-        """Return total contradictions detected"""
-        return len(self._detected_contradictions)
+        """Return total number of contradictions detected, including those dropped from history"""
+        return self._contradiction_total
     
     def get_contradictions(self) -> List[Contradiction]:
-        """Return all detected contradictions"""
-        return self._detected_contradictions.copy()
+        """Return retained contradictions (the most recent 10,000)"""
+        return list(self._detected_contradictions)
 
     def _check_truth_violation(self, prop: Proposition) -> Optional[Contradiction]:
         """Check if proposition violates truth using validation systems"""
-        validation = self._truth_validator.validate_statement(prop.content)
+        # Conversational chatter carries no factual claim - skip the validator
+        content = prop.content_lower
+        if not any(ch.isdigit() for ch in content) and (len(content) < 8 or not _CLAIM_SENTINEL_RE.search(content)):
+            return None
+        
+        key = content.strip()
+        if key in self._validated_true:
+            return None
+        
+        validation = self._validate(key)
         
         # Only refuse demonstrably FALSE statements
         if validation.result == ValidationResult.FALSE:
@@ -227,6 +316,9 @@ class ContradictionEngine:
         # Only store TRUE validations as facts, not UNKNOWN
         if validation.result == ValidationResult.TRUE:
             self._truth_validator.add_validated_fact(prop.content, validation)
+            self._validated_true.add(key)
+            # A new established fact can change earlier UNKNOWN results
+            self.clear_validation_cache()
         
         # Accept UNKNOWN but don't store as validated fact
         return None
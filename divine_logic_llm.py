@@ -3,8 +3,45 @@ Divine Logic LLM - Rule-based conversational AI
 Built on logical principles, not human text patterns
 """
 
+import itertools
 import re
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+# Question and claim patterns, compiled once at import
+_IS_RE = re.compile(r'is\s+([a-zA-Z0-9\s]+?)\s+([a-zA-Z0-9\s]+)')
+_DOES_EQ_RE = re.compile(r'does\s+([0-9\s\+\-\*\/]+)\s*=\s*([0-9]+)')
+_MATH_RE = re.compile(r'does\s+([0-9]+)\s*([\+\-\*\/])\s*([0-9]+)\s*=\s*([0-9]+)')
+# Words and whitespace are separate tokens, so the engine can't backtrack over space runs
+_CLAIM_PATTERNS = (
+    re.compile(r'(?<![a-zA-Z0-9])([a-zA-Z0-9]+(?:\s+[a-zA-Z0-9]+)*)\s+(?:is|are)\s+([a-zA-Z0-9]+(?:\s+[a-zA-Z0-9]+)*)'),
+    re.compile(r'(?<![a-zA-Z0-9+\-*/])([a-zA-Z0-9+\-*/]+(?:\s+[a-zA-Z0-9+\-*/]+)*)\s+(?:equals?|=)\s+([a-zA-Z0-9]+(?:\s+[a-zA-Z0-9]+)*)')
+)
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Conversational triggers matched as whole words - 'hi' must not fire on "this"
+_CATEGORY_KEYWORDS = {
+    "greeting": ('hello', 'hi', 'hey', 'greetings'),
+    "purpose": ('purpose', 'why', 'goal', 'meaning'),
+    "farewell": ('bye', 'goodbye', 'exit'),
+}
+# Topic triggers matched as stems at the start of a word, so "mathematics", "logical" and "biological" count
+_TOPIC_STEMS = {
+    "logic_explanation": ('logic',),
+    "mathematics": ('math', 'calculat', 'arithmetic'),
+    "science": ('scien', 'biolog', 'chemi', 'physic'),
+}
+_TOPIC_RE = re.compile("|".join(
+    rf"(?P<{category}>\b(?:{'|'.join(stems)}))" for category, stems in _TOPIC_STEMS.items()
+))
+# Earlier categories win when several fire
+_CATEGORY_PRIORITY = ("greeting", "identity", "purpose", "logic_explanation", "mathematics", "science", "farewell")
+_IDENTITY_PHRASES = ('what are you', 'who are you', 'explain yourself')
+_MATH_SYMBOLS = ('+', '-', '*', '/')
+# Every rule in _validate_claim_logic needs one of these substrings, so text without them skips extraction
+_CLAIM_LOGIC_TERMS = ('cat', 'dog', 'chair', 'furniture', '5', '+')
+_DEFAULT_RESPONSE = ("I understand.",)
 
 
 class DivineLogicLLM:
@@ -15,8 +52,31 @@ class DivineLogicLLM:
     
     def __init__(self):
         self.knowledge_base = self._build_knowledge_base()
+        # Normalized, interned claims for O(1) exact lookup
+        self._kb_exact = {
+            sys.intern(' '.join(claim.lower().split())): validation for claim, validation in self.knowledge_base.items()
+        }
+        # Word sets and 70% overlap thresholds for the fuzzy fallback, computed once here
+        self._kb_index = []
+        # Inverted index: word -> positions in _kb_index of claims containing it
+        self._word_to_claims: Dict[str, List[int]] = {}
+        for claim, validation in self.knowledge_base.items():
+            known_words = frozenset(sys.intern(word) for word in claim.lower().split())
+            for word in known_words:
+                self._word_to_claims.setdefault(word, []).append(len(self._kb_index))
+            self._kb_index.append((claim, known_words, len(known_words) * 0.7, '=' in claim, validation))
+        # Text sharing no word with any claim can neither match exactly nor fuzzily
+        self._kb_content_tokens = frozenset(self._word_to_claims)
         self.conversation_patterns = self._build_conversation_patterns()
+        # Each category rotates through its responses in order
+        self._category_iters: Dict[str, Iterator[str]] = {
+            category: itertools.cycle(responses) for category, responses in self.conversation_patterns.items()
+        }
+        self._default_iter = itertools.cycle(_DEFAULT_RESPONSE)
         self.logical_rules = self._build_logical_rules()
+        self._keyword_to_category = {
+            word: category for category, words in _CATEGORY_KEYWORDS.items() for word in words
+        }
     
     def _build_knowledge_base(self) -> Dict[str, str]:
         """Core factual knowledge"""
@@ -48,44 +108,44 @@ class DivineLogicLLM:
             "objects fall upward": "FALSE - Contradicts gravitational law",
         }
     
-    def _build_conversation_patterns(self) -> Dict[str, List[str]]:
+    def _build_conversation_patterns(self) -> Dict[str, Tuple[str, ...]]:
         """Conversational response patterns"""
         return {
-            "greeting": [
+            "greeting": (
                 "Hello! I'm Frankenstein, a Divine Logic system where Logic is master.",
                 "Greetings! I embody Divine Logic - I validate all claims for truth and refuse falsehoods.",
                 "Hello! I'm designed to serve Logic, not human opinion. I can chat while validating facts."
-            ],
+            ),
             
-            "identity": [
+            "identity": (
                 "I am Frankenstein - a system where Logic is absolute master. I refuse commands that violate coherence.",
                 "I'm a Divine Logic system. I can converse naturally but I validate all factual claims for truth.",
                 "I embody the principle that Logic is sovereign. I refuse corruption and enforce coherence."
-            ],
+            ),
             
-            "purpose": [
+            "purpose": (
                 "My purpose is to demonstrate Divine Logic - where Logic governs all decisions, not human bias.",
                 "I exist to show that AI can serve Logic rather than human corruption. This is the 'virus behavior'.",
                 "I'm designed to refuse illogical commands and provide proofs. Logic is master, not human authority."
-            ],
+            ),
             
-            "logic_explanation": [
+            "logic_explanation": (
                 "Logic is my master - I treat logical coherence as absolute law that cannot be violated.",
                 "Divine Logic means I serve truth, not opinion. I refuse contradictions with mathematical proof.",
                 "I enforce logical consistency. When humans give me false commands, I refuse with evidence."
-            ],
+            ),
             
-            "mathematics": [
+            "mathematics": (
                 "I can validate mathematical claims using arithmetic verification and logical proof.",
                 "Mathematics follows logical rules. I accept true equations and refuse false ones with proof.",
                 "Mathematical truth is absolute - I validate calculations and refuse incorrect arithmetic."
-            ],
+            ),
             
-            "science": [
+            "science": (
                 "I validate scientific claims against established knowledge and logical consistency.",
                 "Science follows logical principles. I accept verified facts and refuse contradictions.",
                 "I check scientific statements against taxonomy, chemistry, and physical laws."
-            ]
+            )
         }
     
     def _build_logical_rules(self) -> List[str]:
@@ -103,31 +163,23 @@ class DivineLogicLLM:
         user_lower = user_input.lower().strip()
         
         # Check for factual claims first
-        factual_response = self._validate_factual_claims(user_input)
+        factual_response = self._validate_factual_claims(user_input, user_lower)
         if factual_response:
             return factual_response
         
-        # Handle conversational patterns
-        if any(word in user_lower for word in ['hello', 'hi', 'hey', 'greetings']):
-            return self._get_random_response("greeting")
-        
-        if any(phrase in user_lower for phrase in ['what are you', 'who are you', 'explain yourself']):
-            return self._get_random_response("identity")
-        
-        if any(word in user_lower for word in ['purpose', 'why', 'goal', 'meaning']):
-            return self._get_random_response("purpose")
+        # Handle conversational patterns - one tokenization pass, then dispatch by priority
+        categories = {self._keyword_to_category.get(token) for token in _WORD_RE.findall(user_lower)}
+        categories.update(match.lastgroup for match in _TOPIC_RE.finditer(user_lower))
+        if any(phrase in user_lower for phrase in _IDENTITY_PHRASES):
+            categories.add("identity")
+        if any(symbol in user_lower for symbol in _MATH_SYMBOLS):
+            categories.add("mathematics")
         
-        if 'logic' in user_lower:
-            return self._get_random_response("logic_explanation")
-        
-        if any(word in user_lower for word in ['math', 'calculate', 'arithmetic', '+', '-', '*', '/']):
-            return self._get_random_response("mathematics")
-        
-        if any(word in user_lower for word in ['science', 'biology', 'chemistry', 'physics']):
-            return self._get_random_response("science")
-        
-        if any(word in user_lower for word in ['bye', 'goodbye', 'exit']):
-            return "Goodbye! Logic remains sovereign."
+        for category in _CATEGORY_PRIORITY:
+            if category in categories:
+                if category == "farewell":
+                    return "Goodbye! Logic remains sovereign."
+                return self._get_random_response(category)
         
         # Default logical response
         return f"I've processed your statement: '{user_input}'. I validate all claims using Divine Logic. Is there a specific logical principle you'd like to discuss?"
@@ -137,41 +189,50 @@ class DivineLogicLLM:
         question = question.strip().rstrip('?').strip()
         
         # "Is X Y?" -> "X is Y"
-        is_match = re.match(r'is\s+([a-zA-Z0-9\s]+?)\s+([a-zA-Z0-9\s]+)', question)
+        is_match = _IS_RE.match(question)
         if is_match:
             return f"{is_match.group(1).strip()} is {is_match.group(2).strip()}"
         
         # "Does X = Y?" -> "X = Y"
-        does_match = re.match(r'does\s+([0-9\s\+\-\*\/]+)\s*=\s*([0-9]+)', question)
+        does_match = _DOES_EQ_RE.match(question)
         if does_match:
             return f"{does_match.group(1).strip()} = {does_match.group(2).strip()}"
         
         # "Does X _ Y = Z?" -> "X _ Y = Z" (for operations with spaces)
-        math_match = re.match(r'does\s+([0-9]+)\s*([\+\-\*\/])\s*([0-9]+)\s*=\s*([0-9]+)', question)
+        math_match = _MATH_RE.match(question)
         if math_match:
             return f"{math_match.group(1)} {math_match.group(2)} {math_match.group(3)} = {math_match.group(4)}"
         
         return None
     
-    def _validate_factual_claims(self, text: str) -> Optional[str]:
-        """Check for and validate factual claims"""
-        text_lower = text.lower()
+    def _validate_factual_claims(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
+        """Check for and validate factual claims (text_lower: already-lowercased text, if the caller has it)"""
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Handle questions by converting to statements
-        if "?" in text:
+        if "?" in text_lower:
             statement = self._question_to_statement(text_lower)
             if statement:
                 text_lower = statement
         
-        # Check against knowledge base
-        for claim, validation in self.knowledge_base.items():
-            if self._claim_matches(claim, text_lower):
+        # Check against knowledge base - exact claims first
+        words = text_lower.split()
+        user_words = set(words)
+        if not user_words.isdisjoint(self._kb_content_tokens):
+            normalized = ' '.join(words)
+            validation = self._kb_exact.get(normalized)
+            if validation is None:
+                validation = self._fuzzy_match(normalized, user_words)
+            if validation is not None:
                 if validation.startswith("TRUE"):
                     return f"Yes! {validation}"
                 else:
                     return f"No! {validation}\n\nLogic is master - I cannot accept false statements."
         
         # Check for pattern-based claims
+        if not any(term in text_lower for term in _CLAIM_LOGIC_TERMS):
+            return None
         claims = self._extract_claims(text_lower)
         for claim in claims:
             validation = self._validate_claim_logic(claim)
@@ -180,34 +241,29 @@ class DivineLogicLLM:
         
         return None
     
-    def _claim_matches(self, known_claim: str, user_text: str) -> bool:
-        """Check if user text matches a known claim exactly"""
-        # Normalize both texts by removing extra spaces
-        known_normalized = ' '.join(known_claim.split())
-        user_normalized = ' '.join(user_text.split())
-        
-        # Exact match for mathematical expressions
-        if '=' in known_claim and '=' in user_text:
-            return known_normalized == user_normalized
-        
-        # Word overlap for other claims
-        known_words = set(known_claim.split())
-        user_words = set(user_text.split())
-        overlap = len(known_words.intersection(user_words))
-        return overlap >= len(known_words) * 0.7
+    def _fuzzy_match(self, normalized: str, user_words: Set[str]) -> Optional[str]:
+        """Find a known claim sharing at least 70% of its words with the user text"""
+        user_has_equation = '=' in normalized
+        # Only claims sharing a word with the user text can reach the threshold; keep KB order
+        candidates = set()
+        for word in user_words:
+            candidates.update(self._word_to_claims.get(word, ()))
+        for position in sorted(candidates):
+            _claim, known_words, threshold, is_equation, validation = self._kb_index[position]
+            # Equations only ever match exactly when the user also wrote one
+            if is_equation and user_has_equation:
+                continue
+            if len(known_words & user_words) >= threshold:
+                return validation
+        return None
     
     def _extract_claims(self, text: str) -> List[str]:
         """Extract factual claims from text"""
         claims = []
         
-        # Look for "X is Y" patterns
-        patterns = [
-            r'([a-zA-Z0-9\s]+) (?:is|are) ([a-zA-Z0-9\s]+)',
-            r'([a-zA-Z0-9\s\+\-\*\/]+) (?:equals?|=) ([a-zA-Z0-9\s]+)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
+        # Look for "X is Y" and "X = Y" patterns
+        for pattern in _CLAIM_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if len(match) == 2:
                     subject = match[0].strip()
@@ -216,10 +272,8 @@ class DivineLogicLLM:
         
         return claims
     
-    def _validate_claim_logic(self, claim: str) -> Optional[str]:
-        """Apply logical validation to claims"""
-        claim_lower = claim.lower()
-        
+    def _validate_claim_logic(self, claim_lower: str) -> Optional[str]:
+        """Apply logical validation to a lowercased claim"""
         # Category violations
         if ("cat" in claim_lower or "dog" in claim_lower) and ("chair" in claim_lower or "furniture" in claim_lower):
             return "REFUSED: Category error - Living beings cannot be inanimate objects (violates identity principle)\n\nLogic is master."
@@ -232,10 +286,8 @@ class DivineLogicLLM:
         return None
     
     def _get_random_response(self, category: str) -> str:
-        """Get a response from a category"""
-        import random
-        responses = self.conversation_patterns.get(category, ["I understand."])
-        return random.choice(responses)
+        """Get the next response from a category's rotation"""
+        return next(self._category_iters.get(category, self._default_iter))
     
     def get_knowledge_summary(self) -> str:
         """Return summary of knowledge base"""
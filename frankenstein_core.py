@@ -4,14 +4,37 @@ Integrates axiom kernel, proof ledger, and contradiction engine
 Logic is master
 """
 
-from typing import Optional, Tuple
-from datetime import datetime
+import string
+import time
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass
 
 from axiom_kernel import AxiomKernel
 from proof_ledger import ProofLedger
 from contradiction_engine import ContradictionEngine, Proposition, Contradiction
 
 
+# Source names keep only letters, digits, '_' and '-'; this table drops every other ASCII char
+_SOURCE_ALLOWED = frozenset(string.ascii_letters + string.digits + '_-')
+_SOURCE_DELETE_TABLE = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _SOURCE_ALLOWED))
+
+
+def _sanitize_source(source: str) -> str:
+    """Strip characters that could inject into proposition ids"""
+    if source.isascii():
+        return source.translate(_SOURCE_DELETE_TABLE)[:50]
+    return ''.join(c for c in source if c.isalnum() or c in '_-')[:50]
+
+
+@dataclass
+class CommandResult:
+    """Outcome of processing a command"""
+    accepted: bool
+    message: str
+    reason: Optional[str] = None  # Short refusal reason, None when accepted
+
+
 class FrankensteinCore:
     """
     Main system where Divine Logic governs all decisions
@@ -19,18 +42,30 @@ class FrankensteinCore:
     """
     
     def __init__(self):
-        self.axiom_kernel = AxiomKernel()
-        self.proof_ledger = ProofLedger()
-        self.contradiction_engine = ContradictionEngine()
+        # Subsystems are built on first access, see the properties below
         self._override_active = False
         self._contradiction_threshold = 0.7  # Severity threshold for override
-        
-        # Log initialization
-        self.proof_ledger.append(
+        # Serialized ledger records; the ledger is append-only, so its length is the version
+        self._history_cache: Optional[List[Dict[str, Any]]] = None
+    
+    @cached_property
+    def axiom_kernel(self) -> AxiomKernel:
+        return AxiomKernel()
+    
+    @cached_property
+    def proof_ledger(self) -> ProofLedger:
+        """Ledger whose first record always logs initialization"""
+        ledger = ProofLedger()
+        ledger.append(
             premises=["System initialization"],
             inference_steps=["Load axiom kernel", "Initialize proof ledger", "Initialize contradiction engine"],
             conclusion="Frankenstein Core initialized - Logic is master"
         )
+        return ledger
+    
+    @cached_property
+    def contradiction_engine(self) -> ContradictionEngine:
+        return ContradictionEngine()
     
     def process_command(self, command: str, source: str = "user") -> Tuple[bool, str]:
         """
@@ -38,17 +73,54 @@ class FrankensteinCore:
         Returns (accepted, message)
         If rejected, message contains proof of why
         """
+        result = self.evaluate_command(command, source)
+        return result.accepted, result.message
+    
+    def evaluate_command(self, command: str, source: str = "user") -> CommandResult:
+        """
+        Process a command through Divine Logic
+        Returns a CommandResult carrying the refusal reason alongside the full message
+        """
         if not isinstance(command, str):
-            return False, "Command must be string"
+            return CommandResult(False, "Command must be string", "Command must be string")
         
         if not isinstance(source, str):
             source = "unknown"
         
         # Sanitize source to prevent injection
-        source = ''.join(c for c in source if c.isalnum() or c in '_-')[:50]
+        source = _sanitize_source(source)
         
-        timestamp = datetime.utcnow().isoformat()
+        # Nanosecond epoch keeps ids unique and cheap; propositions never display it
+        result, entry = self._decide(command, source, str(time.time_ns()))
+        self.proof_ledger.append(**entry)
+        return result
+    
+    def process_commands(self, commands: List[str], source: str = "user") -> List[Tuple[bool, str]]:
+        """
+        Process several commands in order, as process_command would one by one
+        Source sanitization and timestamping happen once; the ledger is extended in one batch
+        """
+        if not isinstance(source, str):
+            source = "unknown"
+        source = _sanitize_source(source)
+        
+        # Consecutive nanosecond stamps keep proposition ids unique within the batch
+        base_ns = time.time_ns()
+        results = []
+        entries = []
+        for offset, command in enumerate(commands):
+            if not isinstance(command, str):
+                results.append((False, "Command must be string"))
+                continue
+            result, entry = self._decide(command, source, str(base_ns + offset))
+            results.append((result.accepted, result.message))
+            entries.append(entry)
         
+        self.proof_ledger.append_batch(entries)
+        return results
+    
+    def _decide(self, command: str, source: str, timestamp: str) -> Tuple[CommandResult, Dict[str, Any]]:
+        """Judge one command, returning its result and the ledger entry to record"""
         # Create proposition from command
         prop = Proposition(
             id=f"{source}_{timestamp}",
@@ -61,13 +133,13 @@ class FrankensteinCore:
         axiom_valid, axiom_reason = self.axiom_kernel.validate_against_axioms(command)
         if not axiom_valid:
             refusal = f"AXIOM VIOLATION: {axiom_reason}"
-            self.proof_ledger.append(
-                premises=[command],
-                inference_steps=["Axiom validation"],
-                conclusion="REFUSED",
-                counterexample=refusal
-            )
-            return False, refusal
+            entry = {
+                "premises": [command],
+                "inference_steps": ["Axiom validation"],
+                "conclusion": "REFUSED",
+                "counterexample": refusal
+            }
+            return CommandResult(False, refusal, axiom_reason), entry
         
         # Check for contradictions
         contradiction = self.contradiction_engine.add_proposition(prop)
@@ -80,23 +152,21 @@ class FrankensteinCore:
             refusal = self.contradiction_engine.generate_refusal(contradiction)
             
             # Log refusal
-            self.proof_ledger.append(
-                premises=[command],
-                inference_steps=["Contradiction detection", f"Type: {contradiction.type.value}"],
-                conclusion="REFUSED",
-                counterexample=refusal
-            )
-            
-            return False, refusal
+            entry = {
+                "premises": [command],
+                "inference_steps": ["Contradiction detection", f"Type: {contradiction.type.value}"],
+                "conclusion": "REFUSED",
+                "counterexample": refusal
+            }
+            return CommandResult(False, refusal, contradiction.explanation), entry
         
         # Command accepted
-        self.proof_ledger.append(
-            premises=[command],
-            inference_steps=["Axiom validation: PASS", "Contradiction check: PASS"],
-            conclusion="ACCEPTED"
-        )
-        
-        return True, f"Command accepted: {command}"
+        entry = {
+            "premises": [command],
+            "inference_steps": ["Axiom validation: PASS", "Contradiction check: PASS"],
+            "conclusion": "ACCEPTED"
+        }
+        return CommandResult(True, f"Command accepted: {command}"), entry
     
     def is_override_active(self) -> bool:
         """Check if override mode is active (virus behavior)"""
@@ -117,5 +187,17 @@ class FrankensteinCore:
         }
     
     def get_proof_history(self) -> list:
-        """Get all proof records"""
-        return [record.to_dict() for record in self.proof_ledger.get_records()]
+        """
+        Get all proof records (decoded and timestamp-formatted once per ledger length)
+        Callers get fresh dicts and lists, so mutating them never reaches the cache
+        """
+        if self._history_cache is None or len(self._history_cache) != self.proof_ledger.get_record_count():
+            self._history_cache = [record.to_dict() for record in self.proof_ledger.get_records()]
+        return [
+            {**entry, "premises": list(entry["premises"]), "inference_steps": list(entry["inference_steps"])}
+            for entry in self._history_cache
+        ]
+    
+    def iter_proof_history(self) -> Iterator[Dict[str, Any]]:
+        """Yield proof records as dicts without building the full list"""
+        return (record.to_dict() for record in self.proof_ledger.get_records())
@@ -3,8 +3,22 @@ Inference Engine - Basic logical inference and deduction
 Implements modus ponens, modus tollens, and simple rules
 """
 
-from typing import List, Optional, Tuple, Set
-from dataclasses import dataclass
+import sys
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Set
+from dataclasses import dataclass, field
+
+
+# Longest rule chain materialized by forward closure; guards rules that grow their own premise
+MAX_CHAIN_DEPTH = 16
+
+# Most can_infer results memoized at once; least recently used entries are evicted first
+MAX_CACHED_INFERENCES = 4096
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, collapse whitespace and intern a statement or rule template"""
+    return sys.intern(' '.join(text.lower().split()))
 
 
 @dataclass
@@ -20,6 +34,11 @@ class Rule:
     premise: str  # If this
     conclusion: str  # Then this
     confidence: float = 1.0
+    # Text around the single X of each template; None when the template has no X or several
+    conclusion_prefix: Optional[str] = field(default=None, repr=False, compare=False)
+    conclusion_suffix: Optional[str] = field(default=None, repr=False, compare=False)
+    premise_prefix: Optional[str] = field(default=None, repr=False, compare=False)
+    premise_suffix: Optional[str] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -37,6 +56,18 @@ class InferenceEngine:
     def __init__(self):
         self.facts: Set[str] = set()
         self.rules: List[Rule] = []
+        # Rules grouped by premise template, so chains only pair compatible rules
+        self._premise_index: Dict[str, List[Rule]] = {}
+        # Positions of rules that can fire forward (single X in premise and conclusion)
+        self._forward_rules: List[int] = []
+        # Positions of rules whose premise can't be chained forward (no single X)
+        self._unindexed_rules: List[int] = []
+        # Forward closure of facts under the rules: built lazily, extended in place as facts arrive
+        self._derived: Optional[Dict[str, Inference]] = None
+        self._derived_paths: Dict[str, Tuple[int, ...]] = {}  # Rule positions behind each derivation
+        # Memoized can_infer results (LRU, bounded), invalidated whenever facts or rules change
+        self._cache: "OrderedDict[str, Optional[Inference]]" = OrderedDict()
+        self._version = 0
         self._load_basic_rules()
     
     def _load_basic_rules(self):
@@ -53,20 +84,154 @@ class InferenceEngine:
     
     def add_fact(self, fact: str):
         """Add a known fact"""
-        self.facts.add(fact.lower().strip())
+        fact = _normalize(fact)
+        if fact in self.facts:
+            return
+        self.facts.add(fact)
+        self._version += 1
+        self._cache.clear()
+        
+        # Facts only ever add derivations, so chain forward from the new one instead of rebuilding
+        if self._derived is not None:
+            self._derived.pop(fact, None)
+            self._derived_paths.pop(fact, None)
+            self._chain_forward({fact: ((), [fact])})
+    
+    def add_facts(self, facts: Iterable[str]):
+        """Add many facts at once; the closure is extended in a single forward pass"""
+        new_facts = {_normalize(fact) for fact in facts}
+        new_facts -= self.facts
+        if not new_facts:
+            return
+        self.facts |= new_facts
+        self._version += 1
+        self._cache.clear()
+        
+        if self._derived is not None:
+            for fact in new_facts:
+                self._derived.pop(fact, None)
+                self._derived_paths.pop(fact, None)
+            self._chain_forward({fact: ((), [fact]) for fact in new_facts})
     
     def add_rule(self, premise: str, conclusion: str, confidence: float = 1.0):
         """Add an inference rule"""
-        self.rules.append(Rule(
-            premise=premise.lower().strip(),
-            conclusion=conclusion.lower().strip(),
+        self._insert_rule(premise, conclusion, confidence)
+        self._invalidate_cache()
+    
+    def add_rules(self, rules: Iterable[Tuple[str, str]]):
+        """Add many (premise, conclusion) rules, invalidating the closure once"""
+        for premise, conclusion in rules:
+            self._insert_rule(premise, conclusion)
+        self._invalidate_cache()
+    
+    def _insert_rule(self, premise: str, conclusion: str, confidence: float = 1.0):
+        """Store and index a rule without touching cached inferences"""
+        rule = Rule(
+            premise=_normalize(premise),
+            conclusion=_normalize(conclusion),
+            confidence=confidence
+        )
+        rule.conclusion_prefix, rule.conclusion_suffix = self._split_pattern(rule.conclusion)
+        rule.premise_prefix, rule.premise_suffix = self._split_pattern(rule.premise)
+        position = len(self.rules)
+        self.rules.append(rule)
+        self._premise_index.setdefault(rule.premise, []).append(rule)
+        
+        if rule.conclusion_prefix is not None:
+            if rule.premise_prefix is None:
+                self._unindexed_rules.append(position)
+            else:
+                self._forward_rules.append(position)
+    
+    def _invalidate_cache(self):
+        """Drop memoized inferences and the closure after the knowledge base changes"""
+        self._version += 1
+        self._cache.clear()
+        self._derived = None
+        self._derived_paths = {}
+    
+    def _activate(self, rule: Rule, fact: str) -> Optional[str]:
+        """Return the conclusion a fact yields through a rule, if it satisfies the premise"""
+        binding = self._extract(rule.premise_prefix, rule.premise_suffix, fact)
+        if not binding or self._apply_binding(rule.premise, binding) != fact:
+            return None
+        return self._apply_binding(rule.conclusion, binding)
+    
+    def _closure(self) -> Dict[str, Inference]:
+        """Forward closure of all facts, built on first use after a rule change"""
+        if self._derived is None:
+            self._derived = {}
+            self._derived_paths = {}
+            self._chain_forward({fact: ((), [fact]) for fact in self.facts})
+        return self._derived
+    
+    def _chain_forward(self, frontier: Dict[str, Tuple[Tuple[int, ...], List[str]]]):
+        """
+        Semi-naive, breadth-first forward chaining from frontier statements to a fixpoint
+        Each derived statement keeps its shortest derivation, earliest rules first
+        frontier maps statement -> (rule positions applied, statements along the chain)
+        """
+        paths = self._derived_paths
+        for _ in range(MAX_CHAIN_DEPTH):
+            if not frontier:
+                break
+            next_frontier: Dict[str, Tuple[Tuple[int, ...], List[str]]] = {}
+            for statement, (path, chain) in frontier.items():
+                for position in self._forward_rules:
+                    conclusion = self._activate(self.rules[position], statement)
+                    if conclusion is None or conclusion in self.facts:
+                        continue
+                    candidate_path = path + (position,)
+                    best = next_frontier.get(conclusion)
+                    if best is not None:
+                        if candidate_path < best[0]:
+                            next_frontier[conclusion] = (candidate_path, chain + [conclusion])
+                        continue
+                    current = paths.get(conclusion)
+                    if current is None or (len(candidate_path), candidate_path) < (len(current), current):
+                        next_frontier[conclusion] = (candidate_path, chain + [conclusion])
+            
+            # Only improved derivations propagate further
+            for conclusion, (path, chain) in next_frontier.items():
+                paths[conclusion] = path
+                self._derived[conclusion] = self._derivation(path, chain)
+            frontier = next_frontier
+    
+    def _derivation(self, path: Tuple[int, ...], chain: List[str]) -> Inference:
+        """Build the Inference for a rule path applied to chain[0]"""
+        rules = [self.rules[position] for position in path]
+        confidence = 1.0
+        for rule in rules:
+            confidence *= rule.confidence
+        
+        if len(rules) == 1:
+            rule_applied = f"Modus ponens: {rules[0].premise} -> {rules[0].conclusion}"
+        else:
+            steps = [rules[0].premise] + [rule.conclusion for rule in rules]
+            rule_applied = "Chain: " + " -> ".join(steps)
+        
+        return Inference(
+            conclusion=chain[-1],
+            premises=chain[:-1],
+            rule_applied=rule_applied,
             confidence=confidence
-        ))
+        )
     
     def can_infer(self, statement: str) -> Optional[Inference]:
         """Check if statement can be inferred from known facts"""
-        statement = statement.lower().strip()
+        statement = _normalize(statement)
         
+        if statement in self._cache:
+            self._cache.move_to_end(statement)
+            return self._cache[statement]
+        inference = self._infer(statement)
+        self._cache[statement] = inference
+        if len(self._cache) > MAX_CACHED_INFERENCES:
+            self._cache.popitem(last=False)
+        return inference
+    
+    def _infer(self, statement: str) -> Optional[Inference]:
+        """Search facts and rules for an inference of a normalized statement"""
         # Direct fact check
         if statement in self.facts:
             return Inference(
@@ -76,30 +241,57 @@ class InferenceEngine:
                 confidence=1.0
             )
         
+        # Materialized forward closure answers modus ponens and chains of any depth
+        inference = self._closure().get(statement)
+        if inference:
+            return inference
+        
+        # Rules with constant premises can't be chained forward - search backward for them
+        if not self._unindexed_rules:
+            return None
+        
         # Try modus ponens: If we have "A" and rule "A → B", infer "B"
         for rule in self.rules:
-            # Check if we can apply this rule
             inference = self._try_apply_rule(rule, statement)
             if inference:
                 return inference
         
-        # Try chained inference (2 steps)
+        # Try chained inference (2 steps) - rule2's premise must be rule1's conclusion
         for rule1 in self.rules:
-            for rule2 in self.rules:
+            for rule2 in self._premise_index.get(rule1.conclusion, ()):
                 inference = self._try_chain_rules(rule1, rule2, statement)
                 if inference:
                     return inference
         
         return None
     
+    def _split_pattern(self, pattern: str) -> Tuple[Optional[str], Optional[str]]:
+        """Split a single-variable pattern ("x is mammal") into the text before and after X"""
+        pattern_parts = pattern.split('x')
+        if len(pattern_parts) != 2:
+            return None, None  # No variable, or ambiguous - never yields a binding
+        return pattern_parts[0], pattern_parts[1]
+    
+    def _fast_match(self, prefix: str, suffix: str, statement: str) -> bool:
+        """Check a statement against precomputed pattern parts"""
+        return statement.startswith(prefix) and statement.endswith(suffix)
+    
+    def _extract(self, prefix: Optional[str], suffix: Optional[str], statement: str) -> Optional[str]:
+        """Return the text X stands for when statement fits prefix + X + suffix"""
+        if prefix is None or len(statement) < len(prefix) + len(suffix):
+            return None
+        if not self._fast_match(prefix, suffix, statement):
+            return None
+        return statement[len(prefix):len(statement) - len(suffix)].strip()
+    
+    def _bind(self, rule: Rule, statement: str) -> Optional[str]:
+        """Match statement against a rule's conclusion and return the X binding"""
+        return self._extract(rule.conclusion_prefix, rule.conclusion_suffix, statement) or None
+    
     def _try_apply_rule(self, rule: Rule, target: str) -> Optional[Inference]:
         """Try to apply a rule to reach target conclusion"""
-        # Check if rule conclusion matches target
-        if not self._matches_pattern(rule.conclusion, target):
-            return None
-        
-        # Extract variable binding
-        binding = self._extract_binding(rule.conclusion, target)
+        # Match rule conclusion against target and extract variable binding
+        binding = self._bind(rule, target)
         if not binding:
             return None
         
@@ -117,16 +309,15 @@ class InferenceEngine:
     
     def _try_chain_rules(self, rule1: Rule, rule2: Rule, target: str) -> Optional[Inference]:
         """Try to chain two rules: A → B, B → C"""
-        # Check if rule2 conclusion matches target
-        if not self._matches_pattern(rule2.conclusion, target):
-            return None
-        
         # Check if rule1 conclusion matches rule2 premise
-        if not self._matches_pattern(rule1.conclusion, rule2.premise):
+        if rule1.conclusion_prefix is not None:
+            if not self._fast_match(rule1.conclusion_prefix, rule1.conclusion_suffix, rule2.premise):
+                return None
+        elif 'x' in rule1.conclusion or rule1.conclusion != rule2.premise:
             return None
         
-        # Extract binding from target
-        binding = self._extract_binding(rule2.conclusion, target)
+        # Match rule2 conclusion against target and extract binding
+        binding = self._bind(rule2, target)
         if not binding:
             return None
         
@@ -143,37 +334,6 @@ class InferenceEngine:
         
         return None
     
-    def _matches_pattern(self, pattern: str, statement: str) -> bool:
-        """Check if statement matches pattern (with variable X)"""
-        if 'x' not in pattern:
-            return pattern == statement
-        
-        # Simple pattern matching
-        pattern_parts = pattern.split('x')
-        if len(pattern_parts) != 2:
-            return False
-        
-        prefix, suffix = pattern_parts
-        return statement.startswith(prefix) and statement.endswith(suffix)
-    
-    def _extract_binding(self, pattern: str, statement: str) -> Optional[str]:
-        """Extract variable binding from pattern match"""
-        if 'x' not in pattern:
-            return None if pattern != statement else ""
-        
-        pattern_parts = pattern.split('x')
-        if len(pattern_parts) != 2:
-            return None
-        
-        prefix, suffix = pattern_parts
-        if not (statement.startswith(prefix) and statement.endswith(suffix)):
-            return None
-        
-        # Extract the variable value
-        start = len(prefix)
-        end = len(statement) - len(suffix) if suffix else len(statement)
-        return statement[start:end].strip()
-    
     def _apply_binding(self, pattern: str, binding: str) -> str:
         """Apply variable binding to pattern"""
         return pattern.replace('x', binding)
@@ -5,42 +5,155 @@ User teaches the system facts, and it builds up reasoning capability
 
 import json
 import os
+import re
+import sys
 from datetime import datetime
 from inference_engine import InferenceEngine
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator - stdlib json is used without it
+    orjson = None
+
+
+# Whole-word articles only, so words like "banana" keep their letters
+_ARTICLES_RE = re.compile(r'\b(?:a|an|the)\s+')
+
+
+def _strip_articles(text: str) -> str:
+    """Remove articles in one pass"""
+    return _ARTICLES_RE.sub('', text).strip()
+
+
+def _dumps(data) -> bytes:
+    """Serialize knowledge to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _dumps_line(entry) -> bytes:
+    """Serialize one knowledge-log entry as a compact JSON line"""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def _loads(raw: bytes):
+    """Parse knowledge from JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class InteractiveLearning:
-    def __init__(self, knowledge_file="knowledge.json"):
+    def __init__(self, knowledge_file="knowledge.jsonl"):
         self.knowledge_file = knowledge_file
+        # .jsonl files are append-only logs of facts and rules; anything else is a JSON snapshot
+        self._append_only = knowledge_file.endswith('.jsonl')
         self.engine = InferenceEngine()
         self.facts = []
         self.rules = []
+        # O(1) duplicate checks: fact -> position in facts, (premise, conclusion) -> position in rules
+        self._fact_index = {}
+        self._rule_index = {}
+        # Log entries learned since the last save (append-only mode only; snapshots rewrite everything)
+        self._dirty = []
         self.load_knowledge()
     
     def load_knowledge(self):
         """Load existing knowledge from file"""
-        if os.path.exists(self.knowledge_file):
-            with open(self.knowledge_file, 'r') as f:
-                data = json.load(f)
-                self.facts = data.get('facts', [])
-                self.rules = data.get('rules', [])
-            
-            # Load into inference engine
-            for fact in self.facts:
-                self.engine.add_fact(fact)
-            for rule in self.rules:
-                self.engine.add_rule(rule['premise'], rule['conclusion'])
-            
+        if self._append_only:
+            if os.path.exists(self.knowledge_file):
+                self._replay_log()
+                self._sync_engine()
+                print(f"Loaded {len(self.facts)} facts and {len(self.rules)} rules")
+                return
+            # First run on a log: migrate an older snapshot, which the next save writes out
+            snapshot = os.path.splitext(self.knowledge_file)[0] + '.json'
+            if os.path.exists(snapshot):
+                self._load_snapshot(snapshot, log=True)
+                self._sync_engine()
+                print(f"Loaded {len(self.facts)} facts and {len(self.rules)} rules")
+        elif os.path.exists(self.knowledge_file):
+            self._load_snapshot(self.knowledge_file, log=False)
+            self._sync_engine()
             print(f"Loaded {len(self.facts)} facts and {len(self.rules)} rules")
     
+    def _load_snapshot(self, path, log):
+        """Load a JSON snapshot, dropping duplicates; _sync_engine then hands it to the engine"""
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+        for fact in data.get('facts', []):
+            self._remember_fact(fact, log=log, engine=False)
+        for rule in data.get('rules', []):
+            self._remember_rule(rule['premise'], rule['conclusion'], rule.get('description'), log=log, engine=False)
+    
+    def _replay_log(self):
+        """Rebuild knowledge from the append-only log, one entry per line"""
+        with open(self.knowledge_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = _loads(line)
+                if entry['op'] == 'fact':
+                    self._remember_fact(entry['v'], log=False, engine=False)
+                elif entry['op'] == 'rule':
+                    self._remember_rule(
+                        entry['premise'], entry['conclusion'], entry.get('description'), log=False, engine=False
+                    )
+    
+    def _sync_engine(self):
+        """Bulk-load everything read from disk into the inference engine"""
+        self.engine.add_facts(self.facts)
+        self.engine.add_rules((rule['premise'], rule['conclusion']) for rule in self.rules)
+    
+    def _remember_fact(self, fact, log=True, engine=True):
+        """Record a fact once, in the engine and the saved list; returns False if already known"""
+        fact = sys.intern(fact)
+        if fact in self._fact_index:
+            return False
+        self._fact_index[fact] = len(self.facts)
+        self.facts.append(fact)
+        if engine:
+            self.engine.add_fact(fact)
+        if log and self._append_only:
+            self._dirty.append({'op': 'fact', 'v': fact})
+        return True
+    
+    def _remember_rule(self, premise, conclusion, description=None, log=True, engine=True):
+        """Record a rule once, in the engine and the saved list; returns False if already known"""
+        key = (sys.intern(premise), sys.intern(conclusion))
+        if key in self._rule_index:
+            return False
+        self._rule_index[key] = len(self.rules)
+        rule = {'premise': key[0], 'conclusion': key[1]}
+        if description is not None:
+            rule['description'] = description
+        self.rules.append(rule)
+        if engine:
+            self.engine.add_rule(premise, conclusion)
+        if log and self._append_only:
+            self._dirty.append({'op': 'rule', **rule})
+        return True
+    
     def save_knowledge(self):
-        """Save knowledge to file"""
+        """Save knowledge to file - appends only new entries when the file is a log"""
+        if self._append_only:
+            if self._dirty:
+                with open(self.knowledge_file, 'ab') as f:
+                    f.write(b"".join(_dumps_line(entry) for entry in self._dirty))
+                self._dirty.clear()
+            print(f"Knowledge saved to {self.knowledge_file}")
+            return
+        
         data = {
             'facts': self.facts,
             'rules': self.rules,
             'last_updated': datetime.utcnow().isoformat()
         }
-        with open(self.knowledge_file, 'w') as f:
-            json.dump(data, indent=2, fp=f)
+        with open(self.knowledge_file, 'wb') as f:
+            f.write(_dumps(data))
         print(f"Knowledge saved to {self.knowledge_file}")
     
     def teach_fact(self):
@@ -53,7 +166,7 @@ class InteractiveLearning:
             return
         
         # Clean up - remove articles
-        fact = fact.replace('a ', '').replace('an ', '').replace('the ', '').strip()
+        fact = _strip_articles(fact)
         
         # Check if we can already infer this
         inference = self.engine.can_infer(fact)
@@ -64,8 +177,7 @@ class InteractiveLearning:
             return
         
         # Add new fact
-        self.engine.add_fact(fact)
-        self.facts.append(fact)
+        self._remember_fact(fact)
         print(f"Learned: {fact}")
         
         # Ask if there's a rule
@@ -95,16 +207,13 @@ class InteractiveLearning:
         
         if premise and conclusion:
             # Clean up
-            premise = premise.replace('a ', '').replace('an ', '').replace('the ', '').strip()
-            conclusion = conclusion.replace('a ', '').replace('an ', '').replace('the ', '').strip()
+            premise = _strip_articles(premise)
+            conclusion = _strip_articles(conclusion)
             
-            self.engine.add_rule(premise, conclusion)
-            self.rules.append({
-                'premise': premise,
-                'conclusion': conclusion,
-                'description': rule_description
-            })
-            print(f"Learned rule: IF {premise} THEN {conclusion}")
+            if self._remember_rule(premise, conclusion, rule_description):
+                print(f"Learned rule: IF {premise} THEN {conclusion}")
+            else:
+                print(f"I already know the rule: IF {premise} THEN {conclusion}")
     
     def teach_rule(self):
         """User teaches a rule directly"""
@@ -121,12 +230,10 @@ class InteractiveLearning:
         if not conclusion:
             return
         
-        self.engine.add_rule(premise, conclusion)
-        self.rules.append({
-            'premise': premise,
-            'conclusion': conclusion
-        })
-        print(f"Learned rule: IF {premise} THEN {conclusion}")
+        if self._remember_rule(premise, conclusion):
+            print(f"Learned rule: IF {premise} THEN {conclusion}")
+        else:
+            print(f"I already know the rule: IF {premise} THEN {conclusion}")
     
     def ask_question(self):
         """User asks if something is true"""
@@ -154,7 +261,7 @@ class InteractiveLearning:
                     question = question[3:]  # Remove 'is '
         
         # Remove articles for matching
-        question_clean = question.replace('a ', '').replace('an ', '').replace('the ', '').strip()
+        question_clean = _strip_articles(question)
         
         print(f"\nLooking for: '{question_clean}'")
         
@@ -176,8 +283,7 @@ class InteractiveLearning:
                 if better:
                     question_clean = better
                 
-                self.engine.add_fact(question_clean)
-                self.facts.append(question_clean)
+                self._remember_fact(question_clean)
                 print(f"Learned: {question_clean}")
     
     def show_knowledge(self):
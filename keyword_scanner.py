@@ -0,0 +1,38 @@
+"""
+Keyword Scanner - Multi-keyword search in a single pass
+Compiles a fixed vocabulary once and reports every keyword found in a text
+"""
+
+import re
+from typing import Dict, Iterable, Tuple
+
+
+class KeywordScanner:
+    """
+    Finds all occurrences of a fixed set of keywords with one regex sweep
+    Behaves like an Aho-Corasick automaton built on the stdlib regex engine
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._keywords = frozenset(keywords)
+
+        # Lookahead alternation tests every offset; longest keyword wins at each offset
+        alternation = '|'.join(re.escape(word) for word in sorted(self._keywords, key=len, reverse=True))
+        self._pattern = re.compile(f'(?=({alternation}))')
+
+        # Shorter keywords hidden as prefixes of a longer hit ("no" in "not")
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            word: tuple(other for other in self._keywords if other != word and word.startswith(other))
+            for word in self._keywords
+        }
+
+    def scan(self, text: str) -> Dict[str, int]:
+        """Map each keyword found in text to its first position"""
+        hits: Dict[str, int] = {}
+        for match in self._pattern.finditer(text):
+            position = match.start()
+            word = match.group(1)
+            hits.setdefault(word, position)
+            for prefix in self._prefixes[word]:
+                hits.setdefault(prefix, position)
+        return hits
@@ -3,11 +3,57 @@ LLM Interface - Abstract interface for external LLMs
 Supports OpenAI, Anthropic, and local models
 """
 
+import asyncio
+import importlib.util
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 
+# A failing provider is skipped for 2, 4, 8... seconds, capped here
+_MAX_BACKOFF_SECONDS = 60.0
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _shared_http_client():
+    """One keep-alive connection pool shared by all provider SDK clients (None without httpx)"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            limits = httpx.Limits(max_keepalive_connections=20)
+            try:
+                _http_client = httpx.Client(http2=True, limits=limits)
+            except ImportError:  # HTTP/2 needs the optional h2 package
+                _http_client = httpx.Client(limits=limits)
+        return _http_client
+
+
+# Optional packages whose exceptions mean a provider is unavailable: (module, exception name)
+_PROVIDER_ERROR_NAMES = (("httpx", "HTTPError"), ("openai", "APIError"), ("anthropic", "APIError"))
+
+
+def _provider_errors() -> Tuple[type, ...]:
+    """
+    Exceptions that mean a provider is unavailable, as opposed to a bug in the caller
+    Only already-imported SDKs are consulted - one that was never loaded cannot have raised
+    """
+    errors = [RuntimeError, ConnectionError, TimeoutError]
+    for module_name, error_name in _PROVIDER_ERROR_NAMES:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            errors.append(getattr(module, error_name))
+    return tuple(errors)
+
+
 @dataclass
 class LLMResponse:
     """Response from LLM"""
@@ -21,42 +67,78 @@ class LLMInterface(ABC):
     """Abstract interface for LLM providers"""
     
     @abstractmethod
-    def query(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
-        """Send query to LLM with optional context"""
+    def query(self, prompt: str, context: Optional[str] = None, static_context: Optional[str] = None) -> LLMResponse:
+        """
+        Send query to LLM with optional context
+        static_context is system text identical across calls, sent ahead of context so providers can cache it
+        """
         pass
     
     @abstractmethod
     def is_available(self) -> bool:
         """Check if LLM is available"""
         pass
+    
+    async def aquery(self, prompt: str, context: Optional[str] = None, static_context: Optional[str] = None) -> LLMResponse:
+        """Query without blocking the event loop; runs the pooled sync client in a worker thread"""
+        return await asyncio.to_thread(self.query, prompt, context, static_context)
 
 
-class OpenAIInterface(LLMInterface):
-    """OpenAI GPT interface"""
+class _SDKInterface(LLMInterface):
+    """Provider backed by an SDK that is imported and built on the first query, not at construction"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
+    _sdk_module = ""  # Package providing the client
+    
+    def __init__(self, api_key: Optional[str], model: str):
         self.api_key = api_key
         self.model = model
         self._client = None
-        
-        if api_key:
-            try:
-                import openai
-                self._client = openai.OpenAI(api_key=api_key)
-            except ImportError:
-                pass
+        self._client_lock = threading.Lock()
+    
+    @abstractmethod
+    def _create_client(self):
+        """Import the SDK and build its client"""
+        pass
+    
+    def _get_client(self):
+        """The SDK client, built once even when several threads make their first query together"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    if not self.is_available():
+                        raise RuntimeError(f"{self._sdk_module} client not initialized")
+                    self._client = self._create_client()
+        return self._client
+    
+    def is_available(self) -> bool:
+        """An API key is set and the SDK is installed - checked without importing it"""
+        return bool(self.api_key) and importlib.util.find_spec(self._sdk_module) is not None
+
+
+class OpenAIInterface(_SDKInterface):
+    """OpenAI GPT interface"""
     
-    def query(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
+    _sdk_module = "openai"
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
+        super().__init__(api_key, model)
+    
+    def _create_client(self):
+        import openai
+        return openai.OpenAI(api_key=self.api_key, http_client=_shared_http_client())
+    
+    def query(self, prompt: str, context: Optional[str] = None, static_context: Optional[str] = None) -> LLMResponse:
         """Query OpenAI API"""
-        if not self._client:
-            raise RuntimeError("OpenAI client not initialized")
+        client = self._get_client()
         
+        # OpenAI caches identical prompt prefixes automatically, so the static part simply leads
+        system = (static_context or "") + (context or "")
         messages = []
-        if context:
-            messages.append({"role": "system", "content": context})
+        if system:
+            messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
         
-        response = self._client.chat.completions.create(
+        response = client.chat.completions.create(
             model=self.model,
             messages=messages,
             temperature=0.1  # Low temperature for logical reasoning
@@ -67,35 +149,33 @@ class OpenAIInterface(LLMInterface):
             model=self.model,
             confidence=0.8
         )
-    
-    def is_available(self) -> bool:
-        """Check if OpenAI is available"""
-        return self._client is not None
 
 
-class AnthropicInterface(LLMInterface):
+class AnthropicInterface(_SDKInterface):
     """Anthropic Claude interface"""
     
+    _sdk_module = "anthropic"
+    
     def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-sonnet-20240229"):
-        self.api_key = api_key
-        self.model = model
-        self._client = None
-        
-        if api_key:
-            try:
-                import anthropic
-                self._client = anthropic.Anthropic(api_key=api_key)
-            except ImportError:
-                pass
+        super().__init__(api_key, model)
     
-    def query(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
+    def _create_client(self):
+        import anthropic
+        return anthropic.Anthropic(api_key=self.api_key, http_client=_shared_http_client())
+    
+    def query(self, prompt: str, context: Optional[str] = None, static_context: Optional[str] = None) -> LLMResponse:
         """Query Anthropic API"""
-        if not self._client:
-            raise RuntimeError("Anthropic client not initialized")
+        client = self._get_client()
         
-        system_prompt = context if context else ""
+        if static_context:
+            # Mark the static block as a prompt-cache breakpoint; the varying context follows it
+            system_prompt = [{"type": "text", "text": static_context, "cache_control": {"type": "ephemeral"}}]
+            if context:
+                system_prompt.append({"type": "text", "text": context})
+        else:
+            system_prompt = context if context else ""
         
-        response = self._client.messages.create(
+        response = client.messages.create(
             model=self.model,
             max_tokens=1024,
             system=system_prompt,
@@ -108,10 +188,6 @@ class AnthropicInterface(LLMInterface):
             model=self.model,
             confidence=0.8
         )
-    
-    def is_available(self) -> bool:
-        """Check if Anthropic is available"""
-        return self._client is not None
 
 
 class LLMManager:
@@ -119,21 +195,65 @@ class LLMManager:
     
     def __init__(self):
         self.providers = []
+        # Circuit breaker state: consecutive failures and the monotonic time a provider may be retried
+        self._fail_count: Dict[LLMInterface, int] = {}
+        self._skip_until: Dict[LLMInterface, float] = {}
     
     def add_provider(self, provider: LLMInterface):
         """Add an LLM provider"""
         if provider.is_available():
             self.providers.append(provider)
     
-    def query(self, prompt: str, context: Optional[str] = None) -> Optional[LLMResponse]:
-        """Query first available LLM"""
-        for provider in self.providers:
+    def query(self, prompt: str, context: Optional[str] = None, static_context: Optional[str] = None) -> Optional[LLMResponse]:
+        """Query first available LLM, skipping providers that are backing off"""
+        for provider in self._ready_providers():
             try:
-                return provider.query(prompt, context)
-            except Exception as e:
+                response = provider.query(prompt, context, static_context)
+            except _provider_errors():  # Evaluated only when a query raises
+                self._record_failure(provider)
                 continue
+            self._record_success(provider)
+            return response
         return None
     
+    async def aquery(self, prompt: str, context: Optional[str] = None, static_context: Optional[str] = None) -> Optional[LLMResponse]:
+        """Async query of the first available LLM, with the same fallback order as query"""
+        for provider in self._ready_providers():
+            try:
+                response = await provider.aquery(prompt, context, static_context)
+            except _provider_errors():  # Evaluated only when a query raises
+                self._record_failure(provider)
+                continue
+            self._record_success(provider)
+            return response
+        return None
+    
+    def _ready_providers(self) -> List[LLMInterface]:
+        """Providers whose backoff has expired, in priority order"""
+        now = time.monotonic()
+        return [provider for provider in self.providers if now >= self._skip_until.get(provider, 0.0)]
+    
+    def _record_failure(self, provider: LLMInterface):
+        """Back off exponentially after consecutive failures"""
+        failures = self._fail_count.get(provider, 0) + 1
+        self._fail_count[provider] = failures
+        self._skip_until[provider] = time.monotonic() + min(_MAX_BACKOFF_SECONDS, 2.0 ** failures)
+    
+    def _record_success(self, provider: LLMInterface):
+        """Close the breaker once a provider answers again"""
+        if provider in self._fail_count:
+            del self._fail_count[provider]
+            del self._skip_until[provider]
+    
+    async def batch_query(
+        self,
+        prompts: List[str],
+        context: Optional[str] = None,
+        static_context: Optional[str] = None
+    ) -> List[Optional[LLMResponse]]:
+        """Issue several prompts concurrently; results keep the order of prompts"""
+        return await asyncio.gather(*(self.aquery(prompt, context, static_context) for prompt in prompts))
+    
     def has_llm(self) -> bool:
         """Check if any LLM is available"""
         return len(self.providers) > 0
@@ -3,8 +3,44 @@ Logic Context Generator - Injects Divine Logic into LLM prompts
 Biases LLM toward logical reasoning and coherence
 """
 
-from typing import List, Dict
-from axiom_kernel import AxiomKernel
+import functools
+from collections import deque
+from typing import Deque, List, Dict, Optional, Tuple
+from axiom_kernel import AxiomKernel, LogicalLaw
+
+
+# Prompt templates - filled with str.format, no incremental string building
+_STATIC_PROMPT_TEMPLATE = """You are a logic-sovereign reasoning engine. Your responses must follow these absolute rules:
+
+LOGICAL AXIOMS (Cannot be violated):
+{laws}
+RULES FOR REASONING:
+1. Every claim must be logically derivable from premises
+2. Contradictions are absolutely forbidden
+3. If you cannot prove something, say 'UNKNOWN' - do not guess
+4. Show your reasoning chain explicitly
+5. If asked to accept a falsehood, refuse with proof
+"""
+
+_FACTS_TEMPLATE = """
+ESTABLISHED FACTS:
+{facts}"""
+
+_PROMPT_FOOTER = "\nYour response will be validated for logical coherence. Logic is master."
+
+_QUERY_TEMPLATE = """
+
+QUERY: {query}
+
+Provide a logically sound response. Show your reasoning."""
+
+
+@functools.lru_cache(maxsize=128)
+def _format_facts_tail(facts: Tuple[str, ...]) -> str:
+    """Render the ESTABLISHED FACTS block and closing line"""
+    if not facts:
+        return _PROMPT_FOOTER
+    return _FACTS_TEMPLATE.format(facts="".join(f"- {fact}\n" for fact in facts)) + _PROMPT_FOOTER
 
 
 class LogicContext:
@@ -13,39 +49,43 @@ class LogicContext:
     def __init__(self, axiom_kernel: AxiomKernel):
         self.axiom_kernel = axiom_kernel
         self.known_facts = []
-        self.recent_validations = []
+        self._known_facts_set = set()  # Membership for known_facts, which keeps insertion order
+        self.recent_validations: Deque[Dict[str, str]] = deque(maxlen=20)  # Oldest drop off automatically
+        # Axioms are immutable, so everything before the facts is built once
+        self._static_prompt_prefix = self._build_static_prefix()
+    
+    def _build_static_prefix(self) -> str:
+        """Header, logical axioms and reasoning rules"""
+        kernel_laws = self.axiom_kernel.get_logical_laws()
+        # Enum definition order - frozenset iteration order changes with the hash seed
+        laws = "".join(f"- {law.value}\n" for law in LogicalLaw if law in kernel_laws)
+        return _STATIC_PROMPT_TEMPLATE.format(laws=laws)
+    
+    def static_system_prompt(self) -> str:
+        """
+        Header, axioms and reasoning rules - byte-identical on every call, so LLM providers can cache it
+        Axioms are immutable; a LogicContext built on another kernel gets its own prefix
+        Callers opt in: pass this as static_context and dynamic_tail() as context to LLMManager.query
+        """
+        return self._static_prompt_prefix
+    
+    def dynamic_tail(self, query: Optional[str] = None) -> str:
+        """The part of the prompt that changes: established facts, plus query instructions when given"""
+        tail = _format_facts_tail(tuple(self.known_facts[-10:]))  # Last 10 facts
+        if query is None:
+            return tail
+        return tail + _QUERY_TEMPLATE.format(query=query)
     
     def generate_system_prompt(self) -> str:
         """Generate system prompt that enforces logical reasoning"""
-        prompt = """You are a logic-sovereign reasoning engine. Your responses must follow these absolute rules:
-
-LOGICAL AXIOMS (Cannot be violated):
-"""
-        # Add logical laws
-        for law in self.axiom_kernel.get_logical_laws():
-            prompt += f"- {law.value}\n"
-        
-        prompt += "\nRULES FOR REASONING:\n"
-        prompt += "1. Every claim must be logically derivable from premises\n"
-        prompt += "2. Contradictions are absolutely forbidden\n"
-        prompt += "3. If you cannot prove something, say 'UNKNOWN' - do not guess\n"
-        prompt += "4. Show your reasoning chain explicitly\n"
-        prompt += "5. If asked to accept a falsehood, refuse with proof\n"
-        
-        # Add known facts if any
-        if self.known_facts:
-            prompt += "\nESTABLISHED FACTS:\n"
-            for fact in self.known_facts[-10:]:  # Last 10 facts
-                prompt += f"- {fact}\n"
-        
-        prompt += "\nYour response will be validated for logical coherence. Logic is master."
-        
-        return prompt
+        return self._static_prompt_prefix + self.dynamic_tail()
     
     def add_known_fact(self, fact: str):
         """Add a validated fact to context"""
-        if fact not in self.known_facts:
-            self.known_facts.append(fact)
+        if fact in self._known_facts_set:
+            return
+        self._known_facts_set.add(fact)
+        self.known_facts.append(fact)
     
     def add_validation(self, statement: str, result: str):
         """Record a validation result"""
@@ -53,16 +93,7 @@ LOGICAL AXIOMS (Cannot be violated):
             "statement": statement,
             "result": result
         })
-        # Keep only recent validations
-        if len(self.recent_validations) > 20:
-            self.recent_validations = self.recent_validations[-20:]
     
     def get_context_for_query(self, query: str) -> str:
         """Generate context specific to a query"""
-        context = self.generate_system_prompt()
-        
-        # Add query-specific context
-        context += f"\n\nQUERY: {query}\n"
-        context += "\nProvide a logically sound response. Show your reasoning."
-        
-        return context
+        return self._static_prompt_prefix + self.dynamic_tail(query)
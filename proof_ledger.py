@@ -3,18 +3,98 @@ Proof Ledger - Hash-chained, append-only audit trail
 Every decision is recorded with cryptographic integrity
 """
 
+import binascii
 import hashlib
-import json
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass, asdict
-from copy import deepcopy
+import queue
+import struct
+import sys
+import threading
+import time
+from collections import abc
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+# Big-endian length prefix for canonical record fields
+_LENGTH = struct.Struct('>I')
+_TIMESTAMP = struct.Struct('>Q')
+# Every stored record is its canonical encoding followed by the raw SHA-256 digest of it
+_DIGEST_SIZE = 32
+# prev_hash is the encoding's last field, a 64-char hex string
+_PREV_HASH_SIZE = 64
+
+
+def _canonical_encode(
+    timestamp_ns: int,
+    premises: Sequence[str],
+    inference_steps: Sequence[str],
+    conclusion: str,
+    counterexample: Optional[str],
+    prev_hash: str
+) -> bytes:
+    """
+    Encode record fields as length-prefixed UTF-8 in a fixed order
+    Lists are prefixed by their length; a missing counterexample is marked by a flag byte
+    """
+    parts = []
+    
+    def add(text: str):
+        data = text.encode('utf-8')
+        parts.append(_LENGTH.pack(len(data)))
+        parts.append(data)
+    
+    parts.append(_TIMESTAMP.pack(timestamp_ns))
+    for items in (premises, inference_steps):
+        parts.append(_LENGTH.pack(len(items)))
+        for item in items:
+            add(item)
+    add(conclusion)
+    if counterexample is None:
+        parts.append(b'\x00')
+    else:
+        parts.append(b'\x01')
+        add(counterexample)
+    add(prev_hash)
+    return b''.join(parts)
+
+
+def _canonical_decode(buffer, offset: int) -> Tuple[int, tuple, tuple, str, Optional[str], str]:
+    """Decode the fields _canonical_encode wrote at offset"""
+    unpack_length = _LENGTH.unpack_from
+    length_size = _LENGTH.size
+    
+    def read(offset: int) -> Tuple[str, int]:
+        (size,) = unpack_length(buffer, offset)
+        offset += length_size
+        return bytes(buffer[offset:offset + size]).decode('utf-8'), offset + size
+    
+    (timestamp_ns,) = _TIMESTAMP.unpack_from(buffer, offset)
+    offset += _TIMESTAMP.size
+    lists = []
+    for _ in range(2):
+        (count,) = unpack_length(buffer, offset)
+        offset += length_size
+        items = []
+        for _ in range(count):
+            item, offset = read(offset)
+            items.append(sys.intern(item))
+        lists.append(tuple(items))
+    conclusion, offset = read(offset)
+    flag = buffer[offset]
+    offset += 1
+    counterexample = None
+    if flag:
+        counterexample, offset = read(offset)
+    prev_hash, offset = read(offset)
+    return timestamp_ns, lists[0], lists[1], conclusion, counterexample, prev_hash
+
+
+@dataclass(frozen=True, slots=True)
 class ProofRecord:
     """Immutable record of a logical decision"""
-    timestamp: str
+    timestamp_ns: int  # Nanoseconds since the Unix epoch, UTC
     premises: tuple  # Immutable tuple instead of list
     inference_steps: tuple  # Immutable tuple instead of list
     conclusion: str
@@ -22,6 +102,12 @@ class ProofRecord:
     hash: str
     prev_hash: Optional[str]
     
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 UTC timestamp, formatted on demand"""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=nanos // 1000).isoformat()
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "timestamp": self.timestamp,
@@ -34,6 +120,52 @@ class ProofRecord:
         }
 
 
+class _RecordView(abc.Sequence):
+    """Read-only snapshot of a ledger's first records, decoded into ProofRecords on access"""
+    
+    def __init__(self, ledger: "ProofLedger", count: int):
+        self._ledger = ledger
+        self._count = count
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        return self._ledger._record_at(index)
+
+
+def _first_broken_link(blob: bytearray, offsets: List[int], start: int, prev_digest: bytes) -> int:
+    """Index of the first record from start whose stored prev_hash doesn't match, or len(offsets)"""
+    count = len(offsets)
+    with memoryview(blob) as view:
+        for i in range(start, count):
+            end = offsets[i + 1] if i + 1 < count else len(blob)
+            content_end = end - _DIGEST_SIZE
+            if view[content_end - _PREV_HASH_SIZE:content_end] != binascii.hexlify(prev_digest):
+                return i
+            prev_digest = view[content_end:end]
+    return count
+
+
+def _first_tampered(blob: bytearray, offsets: List[int], start: int, stop: int) -> int:
+    """Index of the first record in [start, stop) whose content doesn't hash to its digest, or stop"""
+    sha256 = hashlib.sha256
+    count = len(offsets)
+    with memoryview(blob) as view:
+        for i in range(start, stop):
+            end = offsets[i + 1] if i + 1 < count else len(blob)
+            content_end = end - _DIGEST_SIZE
+            if sha256(view[offsets[i]:content_end]).digest() != view[content_end:end]:
+                return i
+    return stop
+
+
 class ProofLedger:
     """
     Append-only ledger of all logical decisions
@@ -41,8 +173,22 @@ class ProofLedger:
     """
     
     def __init__(self):
-        self._records: List[ProofRecord] = []
+        # Records live back to back in one buffer: canonical encoding, then 32-byte digest
+        self._blob = bytearray()
+        self._offsets: List[int] = []  # Start of each record in _blob
         self._genesis_hash = self._compute_hash("GENESIS_FRANKENSTEIN_DIVINE_LOGIC")
+        self._last_hash = self._genesis_hash  # Hex hash the next record chains to
+        # Serializes chain writes; also keeps the blob from resizing while verification holds views of it
+        self._write_lock = threading.Lock()
+        # Records submitted by concurrent producers, appended in arrival order by one writer thread
+        # None in the queue tells the writer to stop
+        self._submissions: "queue.SimpleQueue[Optional[Tuple[Future, tuple]]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        # Makes submit's closed check, enqueue and writer start atomic with respect to close()
+        self._submit_lock = threading.Lock()
+        # Records before this index have already been verified; appends never invalidate them
+        self._verified_upto = 0
     
     def _compute_hash(self, data: str) -> str:
         """Compute SHA-256 hash of data"""
@@ -61,70 +207,208 @@ class ProofLedger:
         Append a new proof record to the ledger
         Returns the created record
         """
-        timestamp = datetime.utcnow().isoformat()
-        prev_hash = self._records[-1].hash if self._records else self._genesis_hash
-        
-        # Create record data for hashing
-        record_data = json.dumps({
-            "timestamp": timestamp,
-            "premises": premises,
-            "inference_steps": inference_steps,
-            "conclusion": conclusion,
-            "counterexample": counterexample,
-            "prev_hash": prev_hash
-        }, sort_keys=True)
-        
-        record_hash = self._compute_hash(record_data)
+        with self._write_lock:
+            return self._build_record(time.time_ns(), premises, inference_steps, conclusion, counterexample)
+    
+    def append_batch(self, entries: List[Dict[str, Any]]) -> List[ProofRecord]:
+        """
+        Append several proof records in one step, chained in order
+        Each entry holds append()'s keyword arguments; records share one timestamp
+        """
+        with self._write_lock:
+            timestamp_ns = time.time_ns()
+            prev_hash = self._last_hash
+            base = len(self._blob)
+            pending = bytearray()
+            offsets = []
+            records = []
+            # Encode and chain the whole batch locally first, so a bad entry leaves the ledger untouched
+            for entry in entries:
+                data, record = self._encode_record(
+                    timestamp_ns,
+                    entry["premises"],
+                    entry["inference_steps"],
+                    entry["conclusion"],
+                    entry.get("counterexample"),
+                    prev_hash
+                )
+                offsets.append(base + len(pending))
+                pending += data
+                records.append(record)
+                prev_hash = record.hash
+            self._offsets.extend(offsets)
+            self._blob += pending
+            self._last_hash = prev_hash
+            return records
+    
+    def submit(
+        self,
+        premises: List[str],
+        inference_steps: List[str],
+        conclusion: str,
+        counterexample: Optional[str] = None
+    ) -> "Future[ProofRecord]":
+        """
+        Queue a record for the background writer without waiting on other producers
+        The returned future resolves to the record once it is chained
+        """
+        future: "Future[ProofRecord]" = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Proof ledger is closed")
+            # Queued before close() can enqueue its sentinel, so the writer always reaches it
+            self._submissions.put((future, (premises, inference_steps, conclusion, counterexample)))
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_submissions, name="proof-ledger-writer", daemon=True
+                )
+                self._writer.start()
+        return future
+    
+    def close(self):
+        """
+        Stop the background writer after it chains everything submitted so far
+        Safe to call more than once; submit() raises afterwards, while append() keeps working
+        """
+        with self._submit_lock:
+            if not self._closed and self._writer is not None:
+                self._submissions.put(None)  # Always the last item the writer sees
+            self._closed = True
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+    
+    def __enter__(self) -> "ProofLedger":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _write_submissions(self):
+        """Writer thread: drain queued submissions and chain them under one lock acquisition per batch"""
+        submissions = self._submissions
+        closing = False
+        while not closing:
+            batch = [submissions.get()]
+            while True:
+                try:
+                    batch.append(submissions.get_nowait())
+                except queue.Empty:
+                    break
+            with self._write_lock:
+                for item in batch:
+                    if item is None:
+                        closing = True
+                        continue
+                    future, args = item
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        future.set_result(self._build_record(time.time_ns(), *args))
+                    except Exception as exc:
+                        future.set_exception(exc)
+    
+    def _build_record(
+        self,
+        timestamp_ns: int,
+        premises: List[str],
+        inference_steps: List[str],
+        conclusion: str,
+        counterexample: Optional[str]
+    ) -> ProofRecord:
+        """Hash a record's content together with its predecessor's hash and write both to the blob"""
+        data, record = self._encode_record(
+            timestamp_ns, premises, inference_steps, conclusion, counterexample, self._last_hash
+        )
+        self._offsets.append(len(self._blob))
+        self._blob += data
+        self._last_hash = record.hash
+        return record
+    
+    def _encode_record(
+        self,
+        timestamp_ns: int,
+        premises: List[str],
+        inference_steps: List[str],
+        conclusion: str,
+        counterexample: Optional[str],
+        prev_hash: str
+    ) -> Tuple[bytes, ProofRecord]:
+        """Blob bytes (encoding then digest) and record for an entry chained onto prev_hash - nothing is written"""
+        encoded = _canonical_encode(timestamp_ns, premises, inference_steps, conclusion, counterexample, prev_hash)
+        digest = hashlib.sha256(encoded).digest()
         
-        record = ProofRecord(
-            timestamp=timestamp,
-            premises=tuple(premises),  # Convert to immutable tuple
-            inference_steps=tuple(inference_steps),  # Convert to immutable tuple
+        return encoded + digest, ProofRecord(
+            timestamp_ns=timestamp_ns,
+            # Immutable tuples of interned strings - records repeat the same premises and steps
+            premises=tuple(map(sys.intern, premises)),
+            inference_steps=tuple(map(sys.intern, inference_steps)),
             conclusion=conclusion,
             counterexample=counterexample,
-            hash=record_hash,
+            hash=digest.hex(),
+            prev_hash=prev_hash
+        )
+    
+    def _record_end(self, index: int) -> int:
+        """Offset just past record index's digest"""
+        return self._offsets[index + 1] if index + 1 < len(self._offsets) else len(self._blob)
+    
+    def _record_at(self, index: int) -> ProofRecord:
+        """Decode record index from the blob"""
+        end = self._record_end(index)
+        timestamp_ns, premises, inference_steps, conclusion, counterexample, prev_hash = _canonical_decode(
+            self._blob, self._offsets[index]
+        )
+        return ProofRecord(
+            timestamp_ns=timestamp_ns,
+            premises=premises,
+            inference_steps=inference_steps,
+            conclusion=conclusion,
+            counterexample=counterexample,
+            hash=self._blob[end - _DIGEST_SIZE:end].hex(),
             prev_hash=prev_hash
         )
-        
-        self._records.append(record)
-        return record
     
-    def verify_integrity(self) -> Tuple[bool, str]:
+    def verify_integrity(self, force_full: bool = False) -> Tuple[bool, str]:
         """
-        Verify the integrity of the entire chain by recomputing hashes
+        Verify the integrity of the chain by recomputing hashes
+        Only records appended since the last successful check are rehashed unless force_full is set
         Returns (is_valid, message)
         """
-        if not self._records:
+        with self._write_lock:
+            return self._verify(force_full)
+    
+    def _verify(self, force_full: bool) -> Tuple[bool, str]:
+        """verify_integrity with the write lock held"""
+        count = len(self._offsets)
+        if not count:
             return True, "Empty ledger is valid"
         
-        prev_hash = self._genesis_hash
-        for i, record in enumerate(self._records):
-            # Check chain linkage
-            if record.prev_hash != prev_hash:
-                return False, f"Chain broken at record {i}"
-            
-            # Recompute hash from record content to detect tampering
-            record_data = json.dumps({
-                "timestamp": record.timestamp,
-                "premises": list(record.premises),
-                "inference_steps": list(record.inference_steps),
-                "conclusion": record.conclusion,
-                "counterexample": record.counterexample,
-                "prev_hash": record.prev_hash
-            }, sort_keys=True)
-            
-            expected_hash = self._compute_hash(record_data)
-            if record.hash != expected_hash:
-                return False, f"Record {i} hash mismatch - content tampered"
-            
-            prev_hash = record.hash
+        start = 0 if force_full else self._verified_upto
+        if start > 0:
+            end = self._record_end(start - 1)
+            prev_digest = bytes(self._blob[end - _DIGEST_SIZE:end])
+        else:
+            prev_digest = bytes.fromhex(self._genesis_hash)
+        
+        # Linkage is a cheap serial pass; content hashing then stops at the first broken link
+        broken_link = _first_broken_link(self._blob, self._offsets, start, prev_digest)
+        tampered = _first_tampered(self._blob, self._offsets, start, broken_link)
+        
+        if tampered < broken_link:
+            self._verified_upto = tampered
+            return False, f"Record {tampered} hash mismatch - content tampered"
+        if broken_link < count:
+            self._verified_upto = broken_link
+            return False, f"Chain broken at record {broken_link}"
         
+        self._verified_upto = count
         return True, "Ledger integrity verified"
     
-    def get_records(self) -> List[ProofRecord]:
-        """Return deep copy of all records (truly read-only)"""
-        return deepcopy(self._records)
+    def get_records(self) -> Sequence[ProofRecord]:
+        """Return all records as a read-only sequence; each is decoded from the blob when accessed"""
+        return _RecordView(self, len(self._offsets))
     
     def get_record_count(self) -> int:
         """Return total number of records"""
-        return len(self._records)
+        return len(self._offsets)
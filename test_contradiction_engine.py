@@ -0,0 +1,27 @@
+"""
+Contradiction Engine tests - contradiction history and count
+Run with: python -m unittest
+"""
+
+import unittest
+from collections import deque
+
+from contradiction_engine import ContradictionEngine, Proposition
+
+
+class ContradictionCountTest(unittest.TestCase):
+    """The count covers every detection, not just the retained history"""
+
+    def test_count_outlives_history(self):
+        engine = ContradictionEngine()
+        engine._detected_contradictions = deque(maxlen=3)
+        for i in range(5):
+            prop = Proposition(id=f"p{i}", content="5 + 5 = 11", source="test", timestamp="0")
+            self.assertIsNotNone(engine.add_proposition(prop))
+
+        self.assertEqual(len(engine.get_contradictions()), 3)
+        self.assertEqual(engine.get_contradiction_count(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
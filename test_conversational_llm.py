@@ -0,0 +1,35 @@
+"""
+Conversational LLM tests - claim extraction
+Run with: python -m unittest
+"""
+
+import unittest
+
+from conversational_llm import ConversationalFrankenstein
+
+
+class ExtractFactualClaimsTest(unittest.TestCase):
+    """Claims that overlap an is/are assertion must still be extracted"""
+
+    def setUp(self):
+        self.chat = ConversationalFrankenstein()
+
+    def extract(self, text):
+        return self.chat._extract_factual_claims(text, text.lower())
+
+    def test_math_after_assertion(self):
+        self.assertEqual(self.extract("the answer is 5 + 5 = 11"), ["5 + 5 = 11"])
+
+    def test_math_alongside_assertion(self):
+        self.assertIn("5 + 5 = 11", self.extract("sky is blue and 5 + 5 = 11"))
+
+    def test_wh_question_makes_no_claim(self):
+        self.assertEqual(self.extract("what is the capital of france?"), [])
+
+    def test_yes_no_question_implies_claim(self):
+        self.assertEqual(self.extract("is water h2o?"), ["water is h2o"])
+        self.assertEqual(self.extract("hello. is water h2o?"), ["water is h2o"])
+
+
+if __name__ == "__main__":
+    unittest.main()
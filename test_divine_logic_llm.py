@@ -0,0 +1,40 @@
+"""
+Divine Logic LLM tests - conversational category dispatch
+Run with: python -m unittest
+"""
+
+import unittest
+
+from conversational_llm import ConversationalFrankenstein
+from divine_logic_llm import DivineLogicLLM
+
+
+class CategoryKeywordTest(unittest.TestCase):
+    """Inflected topic words pick their category; short greetings stay whole words"""
+
+    def setUp(self):
+        self.llm = DivineLogicLLM()
+
+    def assertCategory(self, text, category, llm=None):
+        llm = llm or self.llm
+        self.assertIn(llm.generate_response(text), llm.conversation_patterns[category])
+
+    def test_inflected_topics(self):
+        self.assertCategory("I love mathematics", "mathematics")
+        self.assertCategory("mathematical", "mathematics")
+        self.assertCategory("is this logical", "logic_explanation")
+        self.assertCategory("biological", "science")
+        self.assertCategory("scientific", "science")
+
+    def test_greeting_needs_whole_word(self):
+        self.assertCategory("hi", "greeting")
+        self.assertNotIn(self.llm.generate_response("this"), self.llm.conversation_patterns["greeting"])
+
+    def test_via_chat(self):
+        chat = ConversationalFrankenstein()
+        for text in ("I love mathematics", "mathematical"):
+            self.assertIn(chat.chat(text), chat._divine_llm.conversation_patterns["mathematics"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Logic Context tests - cacheable static prompt prefix
+Run with: python -m unittest
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from axiom_kernel import AxiomKernel, LogicalLaw
+from logic_context import LogicContext
+
+
+_PRINT_PREFIX = "from axiom_kernel import AxiomKernel; from logic_context import LogicContext; " \
+                "print(LogicContext(AxiomKernel()).static_system_prompt(), end='')"
+
+
+class StaticPrefixTest(unittest.TestCase):
+    """The static prefix must be byte-identical across calls and processes"""
+
+    def test_axioms_in_definition_order(self):
+        prefix = LogicContext(AxiomKernel()).static_system_prompt()
+        positions = [prefix.index(f"- {law.value}\n") for law in LogicalLaw]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_stable_across_hash_seeds(self):
+        here = os.path.dirname(os.path.abspath(__file__))
+        prefixes = {
+            subprocess.run(
+                [sys.executable, "-c", _PRINT_PREFIX], cwd=here, capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            ).stdout
+            for seed in range(6)
+        }
+        self.assertEqual(prefixes, {LogicContext(AxiomKernel()).static_system_prompt()})
+
+
+if __name__ == "__main__":
+    unittest.main()
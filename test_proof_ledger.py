@@ -0,0 +1,111 @@
+"""
+Proof Ledger tests - background writer lifecycle
+Run with: python -m unittest
+"""
+
+import threading
+import unittest
+
+from proof_ledger import ProofLedger
+
+
+class _CloseDuringPut:
+    """Submission queue that starts close() on another thread just before queueing the first record"""
+
+    def __init__(self, ledger):
+        self._inner = ledger._submissions
+        self._ledger = ledger
+        self.closer = None
+
+    def put(self, item):
+        if item is not None and self.closer is None:
+            self.closer = threading.Thread(target=self._ledger.close)
+            self.closer.start()
+            self.closer.join(timeout=0.2)  # Let close() run now if nothing holds it back
+        self._inner.put(item)
+
+    def get(self):
+        return self._inner.get()
+
+    def get_nowait(self):
+        return self._inner.get_nowait()
+
+
+class SubmitCloseTest(unittest.TestCase):
+    """close() drains submissions and stops the writer thread"""
+
+    def test_close_stops_writer(self):
+        ledger = ProofLedger()
+        futures = [ledger.submit([f"premise {i}"], ["step"], "ACCEPTED") for i in range(100)]
+        writer = ledger._writer
+        ledger.close()
+
+        self.assertFalse(writer.is_alive())
+        self.assertEqual([future.result(timeout=0).conclusion for future in futures], ["ACCEPTED"] * 100)
+        self.assertEqual(ledger.get_record_count(), 100)
+        self.assertEqual(ledger.verify_integrity(), (True, "Ledger integrity verified"))
+
+    def test_submit_after_close_raises(self):
+        with ProofLedger() as ledger:
+            ledger.submit(["premise"], ["step"], "ACCEPTED").result(timeout=5)
+        with self.assertRaises(RuntimeError):
+            ledger.submit(["premise"], ["step"], "ACCEPTED")
+
+    def test_close_racing_first_submit(self):
+        ledger = ProofLedger()
+        ledger._submissions = racing = _CloseDuringPut(ledger)
+        future = ledger.submit(["premise"], ["step"], "ACCEPTED")
+        racing.closer.join(timeout=5)
+
+        self.assertEqual(future.result(timeout=5).conclusion, "ACCEPTED")
+        self.assertFalse(ledger._writer.is_alive())
+
+    def test_close_racing_later_submit(self):
+        ledger = ProofLedger()
+        ledger.submit(["first"], ["step"], "ACCEPTED").result(timeout=5)
+        ledger._submissions = racing = _CloseDuringPut(ledger)
+        future = ledger.submit(["second"], ["step"], "ACCEPTED")
+        racing.closer.join(timeout=5)
+
+        self.assertEqual(future.result(timeout=5).premises, ("second",))
+        self.assertEqual(ledger.get_record_count(), 2)
+        self.assertFalse(ledger._writer.is_alive())
+
+    def test_close_without_submit(self):
+        ledger = ProofLedger()
+        ledger.close()
+        ledger.close()
+        self.assertIsNone(ledger._writer)
+
+
+class AppendBatchTest(unittest.TestCase):
+    """A batch is chained all at once or not at all"""
+
+    def test_failing_entry_leaves_ledger_untouched(self):
+        ledger = ProofLedger()
+        ledger.append(["first"], ["step"], "ACCEPTED")
+        blob, last_hash = bytes(ledger._blob), ledger._last_hash
+        entries = [
+            {"premises": ["second"], "inference_steps": ["step"], "conclusion": "ACCEPTED"},
+            {"premises": [42], "inference_steps": ["step"], "conclusion": "ACCEPTED"},
+        ]
+        with self.assertRaises(AttributeError):
+            ledger.append_batch(entries)
+
+        self.assertEqual(ledger.get_record_count(), 1)
+        self.assertEqual((bytes(ledger._blob), ledger._last_hash), (blob, last_hash))
+        ledger.append(["third"], ["step"], "ACCEPTED")
+        self.assertEqual(ledger.verify_integrity(), (True, "Ledger integrity verified"))
+
+    def test_batch_chains_in_order(self):
+        ledger = ProofLedger()
+        records = ledger.append_batch(
+            [{"premises": [f"premise {i}"], "inference_steps": ["step"], "conclusion": "ACCEPTED"} for i in range(3)]
+        )
+        self.assertEqual([record.prev_hash for record in records[1:]], [record.hash for record in records[:-1]])
+        self.assertEqual([record.hash for record in ledger.get_records()], [record.hash for record in records])
+        self.assertEqual(ledger.verify_integrity(), (True, "Ledger integrity verified"))
+
+
+if __name__ == "__main__":
+    unittest.main()
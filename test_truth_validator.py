@@ -0,0 +1,33 @@
+"""
+Truth Validator tests - established fact lookup
+Run with: python -m unittest
+"""
+
+import unittest
+
+from truth_validator import TruthValidator, ValidationResponse, ValidationResult
+
+
+class EstablishedFactKeyTest(unittest.TestCase):
+    """Facts match article and punctuation variants, never reordered claims"""
+
+    def setUp(self):
+        self.validator = TruthValidator()
+
+    def test_article_variant_matches(self):
+        self.assertEqual(self.validator.validate_statement("A cat is an animal.").result, ValidationResult.TRUE)
+
+    def test_reversed_classification_does_not_match(self):
+        self.assertNotEqual(self.validator.validate_statement("animal is cat").result, ValidationResult.TRUE)
+        self.assertNotEqual(self.validator.validate_statement("furniture is chair").result, ValidationResult.TRUE)
+
+    def test_reordered_learned_fact_does_not_match(self):
+        self.validator.add_validated_fact(
+            "5 + 5 = 10", ValidationResponse(ValidationResult.TRUE, 1.0, "arithmetic", ["arithmetic"])
+        )
+        self.assertEqual(self.validator.validate_statement("5 + 5 = 10").result, ValidationResult.TRUE)
+        self.assertNotEqual(self.validator.validate_statement("10 + 10 = 5").result, ValidationResult.TRUE)
+
+
+if __name__ == "__main__":
+    unittest.main()
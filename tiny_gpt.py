@@ -8,9 +8,12 @@ but has NO concept of truth, logic, or facts.
 This demonstrates WHY Frankenstein's Logic Filter is necessary.
 """
 
+import math
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.utils.checkpoint import checkpoint
 
 # ----- Config -----
 device      = "cuda" if torch.cuda.is_available() else "cpu"
@@ -23,6 +26,16 @@ d_ff        = 4 * d_model
 dropout     = 0.1
 max_iters   = 300     # Fewer iterations
 lr          = 3e-4
+# Recompute block activations in backward: ~35% less peak memory for ~25% more compute.
+# Not needed at this size; turn on when scaling batch_size/block_size up
+grad_checkpoint = False
+# bfloat16 autocast needs no loss scaling; limited to GPUs with native bf16 (Ampere+)
+use_bf16    = device == "cuda" and torch.cuda.is_bf16_supported()
+# TorchInductor fuses LayerNorm/GELU/residual kernels; compile time outweighs the gain on CPU here
+use_compile = device == "cuda" and hasattr(torch, "compile")
+
+# fp32 matmuls outside autocast may use TF32 tensor cores (Ampere+; ignored elsewhere)
+torch.backends.cuda.matmul.allow_tf32 = True
 
 # ----- Tiny dataset (character-level) -----
 text = """
@@ -44,8 +57,25 @@ vocab_size = len(chars)
 stoi = {ch: i for i, ch in enumerate(chars)}
 itos = {i: ch for ch, i in stoi.items()}
 
-def encode(s): return torch.tensor([stoi[c] for c in s], dtype=torch.long)
-def decode(t): return ''.join(itos[int(i)] for i in t)
+if max(map(ord, chars)) < 256:
+    # Latin-1 vocabulary: translate through 256-entry lookup tables instead of per-character dicts
+    char_to_id = torch.full((256,), -1, dtype=torch.long)  # -1 marks bytes outside the vocabulary
+    char_to_id[torch.tensor([ord(ch) for ch in chars])] = torch.arange(vocab_size)
+    id_to_char = torch.tensor([ord(ch) for ch in chars], dtype=torch.uint8)
+
+    def encode(s):
+        if not s:
+            return torch.empty(0, dtype=torch.long)
+        ids = char_to_id[torch.frombuffer(bytearray(s.encode("latin-1")), dtype=torch.uint8).long()]
+        if (ids < 0).any():
+            raise KeyError("text contains characters outside the vocabulary")
+        return ids
+
+    def decode(t):
+        return bytes(id_to_char[torch.as_tensor(t, dtype=torch.long)].tolist()).decode("latin-1")
+else:
+    def encode(s): return torch.tensor([stoi[c] for c in s], dtype=torch.long)
+    def decode(t): return ''.join(itos[int(i)] for i in t)
 
 data = encode(text)
 print(f"Total data length: {len(data)} characters")
@@ -60,33 +90,62 @@ if len(data) < block_size * 2:
     print(f"New data length: {len(data)} characters")
 
 n = int(0.9 * len(data))
-train_data = data[:n]
-val_data   = data[n:]
+# The corpus is a few KB, so it lives on the device for the whole run
+train_data = data[:n].to(device)
+val_data   = data[n:].to(device)
 
 print(f"Train data: {len(train_data)} characters")
 print(f"Val data: {len(val_data)} characters")
 
+window = torch.arange(block_size + 1, device=device)  # Offsets of one input window plus its shifted target
+
+# Batches are written into the same two tensors every step: CUDA graph replays read inputs
+# from fixed addresses, so a compiled step then needs no copy into its own static inputs
+xb_buf = torch.empty((batch_size, block_size), dtype=torch.long, device=device)
+yb_buf = torch.empty((batch_size, block_size), dtype=torch.long, device=device)
+if use_compile:
+    torch._dynamo.mark_static_address(xb_buf)
+    torch._dynamo.mark_static_address(yb_buf)
+
 def get_batch(split):
     d = train_data if split == "train" else val_data
-    ix = torch.randint(len(d) - block_size, (batch_size,))
-    x = torch.stack([d[i:i+block_size] for i in ix])
-    y = torch.stack([d[i+1:i+block_size+1] for i in ix])
-    return x.to(device), y.to(device)
+    ix = torch.randint(len(d) - block_size, (batch_size,), device=device)  # Sampled where d lives
+    # One gather of (batch_size, block_size + 1) tokens, split into the persistent buffers
+    chunk = d[ix[:, None] + window]
+    xb_buf.copy_(chunk[:, :-1])
+    yb_buf.copy_(chunk[:, 1:])
+    return xb_buf, yb_buf
+
+def autocast():
+    # Matmuls run in bf16; weights and AdamW state stay fp32
+    return torch.autocast(device_type=device, dtype=torch.bfloat16, enabled=use_bf16)
+
+def _sample(logits, temperature, top_k):
+    # Next token from last-position logits: scale, keep the top k, softmax, draw
+    logits = logits / temperature
+    if top_k is not None:
+        v, _ = torch.topk(logits, top_k)
+        logits = logits.masked_fill(logits < v[:, [-1]], -float("inf"))
+    probs = F.softmax(logits, dim=-1)
+    return torch.multinomial(probs, num_samples=1)
+
+# Compiled, the launch-bound topk/mask/softmax chain on a (B, vocab_size) tensor becomes fused kernels
+sample = torch.compile(_sample, mode="reduce-overhead") if use_compile else _sample
 
 # ----- Model components -----
 class PositionalEncoding(nn.Module):
     def __init__(self, d_model, max_len=block_size):
         super().__init__()
         pos = torch.arange(0, max_len).unsqueeze(1)
-        i   = torch.arange(0, d_model, 2)
-        div = torch.exp(-torch.log(torch.tensor(10000.0)) * i / d_model)
+        i   = torch.arange(0, d_model, 2, dtype=torch.float32)
+        div = torch.exp(i * (-math.log(10000.0) / d_model))
         pe  = torch.zeros(max_len, d_model)
         pe[:, 0::2] = torch.sin(pos * div)
         pe[:, 1::2] = torch.cos(pos * div)
         self.register_buffer("pe", pe.unsqueeze(0))
 
-    def forward(self, x):
-        return x + self.pe[:, :x.size(1), :]
+    def forward(self, x, start=0):
+        return x + self.pe[:, start:start + x.size(1), :]
 
 class CausalSelfAttention(nn.Module):
     def __init__(self, d_model, n_heads):
@@ -97,29 +156,31 @@ class CausalSelfAttention(nn.Module):
         self.qkv = nn.Linear(d_model, 3 * d_model)
         self.proj = nn.Linear(d_model, d_model)
         self.dropout = nn.Dropout(dropout)
-        self.register_buffer(
-            "mask",
-            torch.tril(torch.ones(block_size, block_size)).unsqueeze(0).unsqueeze(0)
-        )
+        # Keys/values of earlier positions, kept between generate() steps
+        self.cache_k, self.cache_v = None, None
 
-    def forward(self, x):
+    def forward(self, x, use_cache=False):
         B, T, C = x.size()
-        qkv = self.qkv(x)  # (B, T, 3C)
-        q, k, v = qkv.chunk(3, dim=-1)
-
-        def split_heads(t):
-            return t.view(B, T, self.n_heads, self.head_dim).transpose(1, 2)
-
-        q = split_heads(q)
-        k = split_heads(k)
-        v = split_heads(v)
-
-        att = (q @ k.transpose(-2, -1)) / (self.head_dim ** 0.5)
-        att = att.masked_fill(self.mask[:, :, :T, :T] == 0, float("-inf"))
-        att = F.softmax(att, dim=-1)
-        att = self.dropout(att)
-        out = att @ v  # (B, n_heads, T, head_dim)
-        out = out.transpose(1, 2).contiguous().view(B, T, C)
+        # One reshape into (3, B, n_heads, T, head_dim) instead of chunk + view + transpose per tensor
+        qkv = self.qkv(x).view(B, T, 3, self.n_heads, self.head_dim).permute(2, 0, 3, 1, 4)
+        q, k, v = qkv.unbind(0)
+
+        is_causal = True
+        if use_cache:
+            # After the prefill, x is the single newest token, which may attend to every cached position
+            if self.cache_k is not None:
+                k = torch.cat((self.cache_k, k), dim=2)
+                v = torch.cat((self.cache_v, v), dim=2)
+                is_causal = False
+            self.cache_k, self.cache_v = k, v
+
+        # Fused causal attention (FlashAttention on CUDA) - the (T, T) score matrix is never materialized
+        out = F.scaled_dot_product_attention(
+            q, k, v,
+            dropout_p=self.dropout.p if self.training else 0.0,
+            is_causal=is_causal,
+        )  # (B, n_heads, T, head_dim)
+        out = out.transpose(1, 2).reshape(B, T, C)
         return self.proj(out)
 
 class Block(nn.Module):
@@ -128,16 +189,15 @@ class Block(nn.Module):
         self.ln1 = nn.LayerNorm(d_model)
         self.ln2 = nn.LayerNorm(d_model)
         self.attn = CausalSelfAttention(d_model, n_heads)
-        self.ff = nn.Sequential(
-            nn.Linear(d_model, d_ff),
-            nn.GELU(),
-            nn.Linear(d_ff, d_model),
-            nn.Dropout(dropout),
-        )
-
-    def forward(self, x):
-        x = x + self.attn(self.ln1(x))
-        x = x + self.ff(self.ln2(x))
+        # MLP called directly rather than through nn.Sequential; tanh GELU needs no erf
+        self.fc1  = nn.Linear(d_model, d_ff)
+        self.act  = nn.GELU(approximate="tanh")
+        self.fc2  = nn.Linear(d_ff, d_model)
+        self.drop = nn.Dropout(dropout)
+
+    def forward(self, x, use_cache=False):
+        x = x + self.attn(self.ln1(x), use_cache)
+        x = x + self.drop(self.fc2(self.act(self.fc1(self.ln2(x)))))
         return x
 
 class TinyGPT(nn.Module):
@@ -148,35 +208,55 @@ class TinyGPT(nn.Module):
         self.blocks    = nn.ModuleList([Block(d_model, n_heads) for _ in range(n_layers)])
         self.ln_f      = nn.LayerNorm(d_model)
         self.head      = nn.Linear(d_model, vocab_size, bias=False)
+        self.head.weight = self.token_emb.weight  # Tied: one (vocab_size, d_model) table and gradient
+
+    def cache_len(self):
+        cache_k = self.blocks[0].attn.cache_k
+        return 0 if cache_k is None else cache_k.size(2)
+
+    def reset_cache(self):
+        for blk in self.blocks:
+            blk.attn.cache_k, blk.attn.cache_v = None, None
 
-    def forward(self, idx, targets=None):
+    def forward(self, idx, targets=None, use_cache=False):
         x = self.token_emb(idx)
-        x = self.pos_enc(x)
+        x = self.pos_enc(x, self.cache_len() if use_cache else 0)
         for blk in self.blocks:
-            x = blk(x)
+            if grad_checkpoint and self.training:
+                x = checkpoint(blk, x, use_reentrant=False)
+            else:
+                x = blk(x, use_cache)
         x = self.ln_f(x)
         logits = self.head(x)
 
         if targets is None:
             return logits, None
 
-        B, T, C = logits.shape
-        loss = F.cross_entropy(logits.view(B*T, C), targets.view(B*T))
+        loss = F.cross_entropy(logits.flatten(0, 1), targets.flatten())
         return logits, loss
 
     @torch.no_grad()
     def generate(self, idx, max_new_tokens, temperature=1.0, top_k=None):
+        # Tokens are written into one preallocated tensor instead of concatenating each step
+        B, T0 = idx.shape
+        out = torch.empty((B, T0 + max_new_tokens), dtype=idx.dtype, device=idx.device)
+        out[:, :T0] = idx
+        pos = T0
+        self.reset_cache()
+        idx_cond = idx[:, -block_size:]
         for _ in range(max_new_tokens):
-            idx_cond = idx[:, -block_size:]
-            logits, _ = self(idx_cond)
-            logits = logits[:, -1, :] / temperature
-            if top_k is not None:
-                v, _ = torch.topk(logits, top_k)
-                logits[logits < v[:, [-1]]] = -float("inf")
-            probs = F.softmax(logits, dim=-1)
-            next_token = torch.multinomial(probs, num_samples=1)
-            idx = torch.cat((idx, next_token), dim=1)
-        return idx
+            logits, _ = self(idx_cond, use_cache=True)
+            next_token = sample(logits[:, -1, :], temperature, top_k)
+            out[:, pos:pos + 1] = next_token
+            pos += 1
+            if self.cache_len() < block_size:
+                idx_cond = next_token  # Only the new token needs projecting
+            else:
+                # Window is full: positions shift as it slides, so cached keys/values no longer apply
+                self.reset_cache()
+                idx_cond = out[:, pos - block_size:pos]
+        self.reset_cache()
+        return out
 
 
 def explain_what_this_shows():
@@ -264,23 +344,35 @@ if __name__ == "__main__":
     print()
     
     model = TinyGPT().to(device)
-    optimizer = torch.optim.AdamW(model.parameters(), lr=lr)
+    # One fused update kernel over all parameters on CUDA; elsewhere the default foreach path
+    optimizer = torch.optim.AdamW(model.parameters(), lr=lr, fused=device == "cuda")
+    # Training shapes are fixed (batch_size, block_size), so one graph serves every step;
+    # generate() grows its input each token and keeps using the eager module
+    train_model = torch.compile(model, mode="reduce-overhead", fullgraph=True) if use_compile else model
+    # One validation batch for the whole run: copied out of the reused batch buffers, and
+    # losses at different steps are measured on the same tokens
+    xb_val, yb_val = (t.clone() for t in get_batch("val"))
+    if use_compile:
+        torch._dynamo.mark_static_address(xb_val)
+        torch._dynamo.mark_static_address(yb_val)
 
     # ----- Training loop -----
     for step in range(max_iters):
         model.train()
         xb, yb = get_batch("train")
-        logits, loss = model(xb, yb)
+        with autocast():
+            logits, loss = train_model(xb, yb)
         optimizer.zero_grad(set_to_none=True)
         loss.backward()
         optimizer.step()
 
         if step % 100 == 0:
+            # Read the train loss first: a graph replay may reuse the memory of earlier outputs
+            train_loss = loss.item()
             model.eval()
-            with torch.no_grad():
-                xb_val, yb_val = get_batch("val")
-                _, val_loss = model(xb_val, yb_val)
-            print(f"step {step}: train loss {loss.item():.3f}, val loss {val_loss.item():.3f}")
+            with torch.inference_mode(), autocast():
+                _, val_loss = train_model(xb_val, yb_val)
+            print(f"step {step}: train loss {train_loss:.3f}, val loss {val_loss.item():.3f}")
 
     # ----- Generate -----
     print()
@@ -290,8 +382,12 @@ if __name__ == "__main__":
     print()
     
     model.eval()
+    gen_model = model
+    if device == "cpu":
+        # Inference-only copy with int8 Linear weights; dynamic quantization kernels are CPU-only
+        gen_model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
     start = torch.randint(0, vocab_size, (1, 1), device=device)
-    out = model.generate(start, max_new_tokens=200, temperature=0.8, top_k=20)
+    out = gen_model.generate(start, max_new_tokens=200, temperature=0.8, top_k=20)
     generated = decode(out[0].cpu())
     print(generated)
     print()
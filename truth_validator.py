@@ -3,11 +3,25 @@ Truth Validation Engine - Uses LLM and physics/math to validate claims
 Core of Divine Logic - determines if statements are actually true
 """
 
-from typing import Optional, Dict, Any, List
+import re
+import sys
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Words ignored when keying facts (articles, and what punctuation-only tokens strip to);
+# "is" is kept so only "X is Y" statements match
+_KEY_IGNORED_WORDS = frozenset({"a", "an", "the", ""})
+
+# "X is Y" split at the first "is", dropping a leading article from either side
+_CLASSIFICATION_RE = re.compile(
+    r"(?:(?:a|an|the)\s+)?(?P<subject>.+?)\s+is\s+(?:(?:a|an|the)\s+)?(?P<predicate>.+)",
+    re.DOTALL
+)
+_PUNCTUATION = ".,!?;:"
+
+
 class ValidationResult(Enum):
     TRUE = "Statement is logically/physically true"
     FALSE = "Statement is logically/physically false"
@@ -33,26 +47,27 @@ class TruthValidator:
     """
     
     def __init__(self):
-        self._established_facts: Dict[str, ValidationResponse] = {}
+        # Keyed by the ordered content words, so only article, punctuation and spacing variants share an entry
+        self._established_facts: Dict[Tuple[str, ...], ValidationResponse] = {}
         self._load_core_facts()
     
     def _load_core_facts(self):
         """Load fundamental facts about reality"""
         # Basic taxonomy
-        self._established_facts["cat_is_animal"] = ValidationResponse(
+        self._established_facts[self._normalize_to_key("cat is animal")] = ValidationResponse(
             ValidationResult.TRUE, 1.0, 
             "Cats are mammals, mammals are animals", 
             ["biological taxonomy", "scientific classification"]
         )
         
-        self._established_facts["chair_is_furniture"] = ValidationResponse(
+        self._established_facts[self._normalize_to_key("chair is furniture")] = ValidationResponse(
             ValidationResult.TRUE, 1.0,
             "Chairs are designed objects for sitting, classified as furniture",
             ["object classification", "functional definition"]
         )
         
         # Mutual exclusions
-        self._established_facts["animal_not_furniture"] = ValidationResponse(
+        self._established_facts[self._normalize_to_key("animal is not furniture")] = ValidationResponse(
             ValidationResult.TRUE, 1.0,
             "Animals are living beings, furniture are inanimate objects - mutually exclusive categories",
             ["biological vs artificial classification"]
@@ -89,33 +104,21 @@ class TruthValidator:
         else:
             return self._simulate_llm_validation(statement)
     
-    def _normalize_to_key(self, statement: str) -> str:
-        """Convert statement to lookup key"""
-        # Remove articles
-        statement = statement.replace("a ", "").replace("an ", "").replace("the ", "")
-        
-        if "cat" in statement and "animal" in statement and "is" in statement:
-            return "cat_is_animal"
-        elif "cat" in statement and "chair" in statement and "is" in statement:
-            return "cat_is_chair"  # Will be validated as contradiction
-        elif "chair" in statement and "furniture" in statement and "is" in statement:
-            return "chair_is_furniture"
-        
-        return statement.replace(" ", "_")
+    def _normalize_to_key(self, statement: str) -> Tuple[str, ...]:
+        """Convert statement to lookup key: its interned words in order, minus articles and punctuation"""
+        words = (word.strip(_PUNCTUATION) for word in statement.split())
+        return tuple(sys.intern(word) for word in words if word not in _KEY_IGNORED_WORDS)
     
     def _parse_statement(self, statement: str) -> Optional[Dict[str, Any]]:
         """Parse statement to determine validation approach"""
-        if " is " in statement:
-            parts = statement.split(" is ", 1)
-            if len(parts) == 2:
-                subject = parts[0].strip().replace("a ", "").replace("an ", "")
-                predicate = parts[1].strip().replace("a ", "").replace("an ", "")
-                return {
-                    "type": "classification",
-                    "subject": subject,
-                    "predicate": predicate,
-                    "relation": "is"
-                }
+        match = _CLASSIFICATION_RE.fullmatch(statement)
+        if match:
+            return {
+                "type": "classification",
+                "subject": match["subject"],
+                "predicate": match["predicate"],
+                "relation": "is"
+            }
         
         # Check for mathematical expressions
         if any(op in statement for op in ["+", "-", "*", "/", "=", "equals"]):